@@ -4,6 +4,8 @@ Script para crear todos los archivos faltantes en el servidor Linux.
 Ejecutar: python create_missing_files.py
 """
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Contenido de config/settings.py
@@ -11,22 +13,53 @@ CONFIG_SETTINGS = '''"""
 Configuration management for the arbitrage bot.
 Handles environment variables, channel mappings, and bot settings.
 """
+import copy
+import functools
 import os
 import yaml
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Load environment variables
-load_dotenv()
+if not os.environ.get("TELEGRAM_BOT_TOKEN"):
+    load_dotenv(override=False)
+
+_SRC_DIR = os.path.dirname(__file__)
+_PROJECT_ROOT = os.path.abspath(os.path.join(_SRC_DIR, os.pardir))
+_PRIORITY = ("config-configurada.yml", "config.yml")
+_HTTP_SCHEMES = ("http://", "https://")
+_ROOT_CONFIG = os.path.join(_PROJECT_ROOT, "config.yml")
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data or {}
+
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # Nested dicts in the cache are shared: hand each caller its own copy
+    return copy.deepcopy(_parse_yaml(path, mtime_ns, size))
+
+def _int_env(env: Mapping[str, str], key: str, default: int) -> int:
+    raw = env.get(key)
+    if raw is None:
+        return default
+    return int(raw)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TelegramConfig:
     """Telegram bot configuration"""
     bot_token: str
     support_channel_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BetburgerConfig:
     """Betburger web scraping configuration"""
     username: Optional[str] = None
@@ -34,7 +67,7 @@ class BetburgerConfig:
     base_url: str = "https://betburger.com"
     login_url: str = "https://betburger.com/users/sign_in"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SurebetConfig:
     """Surebet web scraping configuration"""
     username: Optional[str] = None
@@ -43,7 +76,7 @@ class SurebetConfig:
     login_url: str = "https://es.surebet.com/users/sign_in"
     valuebets_url: str = "https://es.surebet.com/valuebets"
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """General bot configuration"""
     scraping_interval: int = 5
@@ -61,104 +94,137 @@ class BotConfig:
 
 class ConfigManager:
     """Manages all bot configuration"""
+
+    _resolved_paths: Dict[str, str] = {}
     
     def __init__(self, config_dir: str = "config"):
+        self._env = dict(os.environ)
         self.config_dir = config_dir
         self.telegram = self._load_telegram_config()
         self.betburger = self._load_betburger_config()
         self.surebet = self._load_surebet_config()
         self.bot = self._load_bot_config()
         self.channels = self._load_channel_mapping()
+        self._index_channels()
     
     @staticmethod
     def _sanitize_url(value: Optional[str], default: str) -> str:
-        if value and value.strip().lower().startswith(("http://", "https://")):
+        if value and value.strip().lower().startswith(_HTTP_SCHEMES):
             return value.strip()
         return default
 
     def _load_telegram_config(self) -> TelegramConfig:
+        g = self._env.get
         return TelegramConfig(
-            bot_token=os.getenv("TELEGRAM_BOT_TOKEN", ""),
-            support_channel_id=os.getenv("TELEGRAM_SUPPORT_CHANNEL_ID", "")
+            bot_token=g("TELEGRAM_BOT_TOKEN", ""),
+            support_channel_id=g("TELEGRAM_SUPPORT_CHANNEL_ID", "")
         )
     
     def _load_betburger_config(self) -> BetburgerConfig:
-        env_base = os.getenv("BETBURGER_BASE_URL")
-        env_login = os.getenv("BETBURGER_LOGIN_URL")
+        g = self._env.get
+        env_base = g("BETBURGER_BASE_URL")
+        env_login = g("BETBURGER_LOGIN_URL")
         return BetburgerConfig(
-            username=os.getenv("BETBURGER_USERNAME"),
-            password=os.getenv("BETBURGER_PASSWORD"),
+            username=g("BETBURGER_USERNAME"),
+            password=g("BETBURGER_PASSWORD"),
             base_url=self._sanitize_url(env_base, "https://betburger.com"),
             login_url=self._sanitize_url(env_login, "https://betburger.com/users/sign_in"),
         )
     
     def _load_surebet_config(self) -> SurebetConfig:
-        env_base = os.getenv("SUREBET_BASE_URL")
-        env_login = os.getenv("SUREBET_LOGIN_URL")
-        env_valuebets = os.getenv("SUREBET_VALUEBETS_URL")
+        g = self._env.get
+        env_base = g("SUREBET_BASE_URL")
+        env_login = g("SUREBET_LOGIN_URL")
+        env_valuebets = g("SUREBET_VALUEBETS_URL")
         return SurebetConfig(
-            username=os.getenv("SUREBET_USERNAME"),
-            password=os.getenv("SUREBET_PASSWORD"),
+            username=g("SUREBET_USERNAME"),
+            password=g("SUREBET_PASSWORD"),
             base_url=self._sanitize_url(env_base, "https://es.surebet.com"),
             login_url=self._sanitize_url(env_login, "https://es.surebet.com/users/sign_in"),
             valuebets_url=self._sanitize_url(env_valuebets, "https://es.surebet.com/valuebets"),
         )
     
     def _load_bot_config(self) -> BotConfig:
+        env = self._env
+        g = env.get
         return BotConfig(
-            scraping_interval=int(os.getenv("SCRAPING_INTERVAL", "5")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            alert_timeout=int(os.getenv("ALERT_TIMEOUT", "2")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file=os.getenv("LOG_FILE", "logs/bot.log"),
-            headless_mode=os.getenv("HEADLESS_MODE", "false").lower() == "true",
-            browser_timeout=int(os.getenv("BROWSER_TIMEOUT", "30")),
-            proxy_type=os.getenv("BROWSER_PROXY_TYPE"),
-            proxy_host=os.getenv("BROWSER_PROXY_HOST"),
-            proxy_port=int(os.getenv("BROWSER_PROXY_PORT", "0")) or None,
-            proxy_username=os.getenv("BROWSER_PROXY_USERNAME"),
-            proxy_password=os.getenv("BROWSER_PROXY_PASSWORD"),
+            scraping_interval=_int_env(env, "SCRAPING_INTERVAL", 5),
+            max_retries=_int_env(env, "MAX_RETRIES", 3),
+            alert_timeout=_int_env(env, "ALERT_TIMEOUT", 2),
+            log_level=g("LOG_LEVEL", "INFO"),
+            log_file=g("LOG_FILE", "logs/bot.log"),
+            headless_mode=g("HEADLESS_MODE", "false").lower() == "true",
+            browser_timeout=_int_env(env, "BROWSER_TIMEOUT", 30),
+            proxy_type=g("BROWSER_PROXY_TYPE"),
+            proxy_host=g("BROWSER_PROXY_HOST"),
+            proxy_port=_int_env(env, "BROWSER_PROXY_PORT", 0) or None,
+            proxy_username=g("BROWSER_PROXY_USERNAME"),
+            proxy_password=g("BROWSER_PROXY_PASSWORD"),
         )
     
-    def _load_channel_mapping(self) -> Dict:
-        src_dir = os.path.dirname(__file__)
-        project_root = os.path.abspath(os.path.join(src_dir, os.pardir))
-        configured = os.path.join(src_dir, "config-configurada.yml")
-        preferred = os.path.join(src_dir, "config.yml")
-        root_config = os.path.join(project_root, "config.yml")
-        fallback = os.path.join(project_root, self.config_dir, "channels.yaml")
-
-        for path in (configured, preferred, root_config, fallback):
+    def _load_channel_mapping(self) -> Mapping:
+        path = ConfigManager._resolved_paths.get(self.config_dir)
+        if path is not None:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    if data:
-                        return data
+                st = os.stat(path)
             except FileNotFoundError:
-                continue
+                st = None
+            if st is not None:
+                data = _parse_yaml_cached(path, st.st_mtime_ns, st.st_size)
+                if data:
+                    return data
+            ConfigManager._resolved_paths.pop(self.config_dir, None)
+
+        for path, st in self._iter_channel_files():
+            data = _parse_yaml_cached(path, st.st_mtime_ns, st.st_size)
+            if data:
+                ConfigManager._resolved_paths[self.config_dir] = path
+                return data
         return {}
+
+    def _iter_channel_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        with os.scandir(_SRC_DIR) as it:
+            entries = {e.name: e for e in it if e.is_file()}
+        for name in _PRIORITY:
+            entry = entries.get(name)
+            if entry is not None:
+                yield entry.path, entry.stat()
+
+        fallback = os.path.join(_PROJECT_ROOT, self.config_dir, "channels.yaml")
+        for path in map(Path, (_ROOT_CONFIG, fallback)):
+            if path.is_file():
+                yield str(path), path.stat()
+
+    def _index_channels(self) -> None:
+        self._flat_channels: Dict[tuple, str] = {}
+        self._flat_defaults: Dict[tuple, Dict] = {}
+        self._flat_ui_filter: Dict[tuple, str] = {}
+        for platform in ("betburger", "surebet"):
+            for profile, data in (self.channels.get(f"{platform}_profiles") or {}).items():
+                if not isinstance(data, dict):
+                    continue
+                key = (platform, profile)
+                if data.get("channel_id"):
+                    self._flat_channels[key] = data["channel_id"]
+                if data.get("defaults"):
+                    self._flat_defaults[key] = data["defaults"]
+                ui_filter = data.get("ui_filter_name")
+                if isinstance(ui_filter, str) and ui_filter.strip():
+                    self._flat_ui_filter[key] = ui_filter.strip()
+        support = (self.channels.get("support") or {}).get("technical_alerts") or {}
+        self._support_channel: Optional[str] = support.get("channel_id")
     
     def get_channel_for_profile(self, platform: str, profile: str) -> Optional[str]:
-        if platform == "betburger":
-            return self.channels.get("betburger_profiles", {}).get(profile, {}).get("channel_id")
-        elif platform == "surebet":
-            return self.channels.get("surebet_profiles", {}).get(profile, {}).get("channel_id")
-        return None
+        return self._flat_channels.get((platform, profile))
     
     def get_support_channel(self) -> Optional[str]:
-        return self.channels.get("support", {}).get("technical_alerts", {}).get("channel_id")
+        return self._support_channel
 
     def get_profile_defaults(self, platform: str, profile: str) -> Dict:
-        key = f"{platform}_profiles"
-        return self.channels.get(key, {}).get(profile, {}).get("defaults", {}) or {}
+        return self._flat_defaults.get((platform, profile)) or {}
 
     def get_profile_ui_filter_name(self, platform: str, profile: str) -> Optional[str]:
-        key = f"{platform}_profiles"
-        value = self.channels.get(key, {}).get(profile, {}).get("ui_filter_name")
-        if isinstance(value, str):
-            v = value.strip()
-            return v or None
-        return None
+        return self._flat_ui_filter.get((platform, profile))
 '''
 
 # Contenido simplificado de processors/arbitrage_data.py
@@ -172,12 +238,12 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BookmakerSelection:
     bookmaker: str
     odd: float
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageData:
     source: str
     profile: str
@@ -207,19 +273,83 @@ from __future__ import annotations
 
 import os
 import asyncio
+import functools
+import importlib.util
+import threading
+import time
 from typing import Optional, Dict, Any
 from datetime import datetime
 import structlog
 
+from processors.arbitrage_data import ArbitrageData
+
 try:
     import telegram
     from telegram import Bot
     from telegram.constants import ParseMode
+    from telegram.request import HTTPXRequest
 except ImportError:
     telegram = None
 
 logger = structlog.get_logger(__name__)
 
+# Alert header: "<urgency> <source emoji> **<SOURCE> ALERT**"
+_format_header = "{} {} **{} ALERT**".format
+_format_link = "   • [{}]({})".format
+
+
+# Telegram limits: ~1 message/s per chat, ~30 messages/s overall
+_PER_CHAT_INTERVAL = 1.0
+_GLOBAL_CONCURRENCY = 30
+
+_URGENCY_EMOJIS = {
+    "critical": "🚨",
+    "high": "⚡",
+    "medium": "⏰",
+    "low": "📅",
+    "unknown": "❓",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _source_label(source: str) -> str:
+    """Upper-cased source name; sources come from a small fixed set."""
+    return source.upper()
+
+
+_sync_state = threading.local()
+
+
+def run_sync(coro):
+    """Run a coroutine from synchronous code.
+
+    Reuses one private event loop per thread so pooled HTTP connections
+    survive between calls. Code already running inside an event loop must
+    await the coroutine itself; calling this from there raises RuntimeError.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        name = getattr(coro, "__qualname__", "the coroutine")
+        coro.close()
+        raise RuntimeError(f"Synchronous wrapper called inside a running event loop; await {name}() instead")
+
+    loop = getattr(_sync_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _sync_state.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+def close_sync_loop() -> None:
+    """Close this thread's private run_sync loop, if it has one."""
+    loop = getattr(_sync_state, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+    _sync_state.loop = None
+
 
 class TelegramSender:
     """Sends arbitrage alerts to Telegram channels."""
@@ -228,6 +358,15 @@ class TelegramSender:
         """Initialize Telegram sender."""
         self.bot_token = bot_token or os.environ.get("TELEGRAM_BOT_TOKEN")
         self.bot = None
+        self._request = None
+        # (epoch second, "%H:%M:%S") of the last footer; bursts share a second
+        self._ts_cache = (0, "")
+        # Send pacing: FIFO lock + earliest next send time per channel
+        self._channel_locks: Dict[str, asyncio.Lock] = {}
+        self._next_send: Dict[str, float] = {}
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._pacing_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._log_error = logger.bind().error
         
         if not self.bot_token:
             logger.warning("No Telegram bot token provided")
@@ -238,121 +377,178 @@ class TelegramSender:
             return
         
         try:
-            self.bot = Bot(token=self.bot_token)
+            self._request = self._build_request()
+            self.bot = Bot(
+                token=self.bot_token,
+                request=self._request,
+                get_updates_request=self._request,
+            )
             logger.info("Telegram bot initialized successfully")
         except Exception as e:
             logger.error("Failed to initialize Telegram bot", error=str(e))
     
-    def format_arbitrage_message(self, arb_data) -> str:
+    @staticmethod
+    def _build_request():
+        """HTTP/2 request pool, or HTTP/1.1 when the h2 package is missing."""
+        options = dict(connection_pool_size=32, pool_timeout=1.0, read_timeout=15, connect_timeout=5)
+        # PTB raises RuntimeError (not ImportError) for http_version="2" without h2
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("h2 not installed, using HTTP/1.1. Install with: pip install 'python-telegram-bot[http2]'")
+            return HTTPXRequest(**options)
+        return HTTPXRequest(http_version="2", **options)
+    
+    async def close_async(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._request is not None:
+            await self._request.shutdown()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP client and this thread's private event loop."""
+        run_sync(self.close_async())
+        close_sync_loop()
+    
+    def format_arbitrage_message(self, arb_data: ArbitrageData) -> str:
         """Format arbitrage data into rich Telegram message."""
-        from processors.arbitrage_data import ArbitrageData
-        
-        if not isinstance(arb_data, ArbitrageData):
+        try:
+            source = arb_data.source
+        except AttributeError:
             return "❌ Invalid arbitrage data"
         
         # Urgency emoji
-        urgency_emojis = {
-            "critical": "🚨",
-            "high": "⚡",
-            "medium": "⏰", 
-            "low": "📅",
-            "unknown": "❓"
-        }
-        
-        urgency_emoji = urgency_emojis.get(arb_data.urgency_level, "❓")
+        urgency_emoji = _URGENCY_EMOJIS.get(arb_data.urgency_level, "❓")
         
         # Source emoji
-        source_emoji = "🎯" if arb_data.source == "betburger" else "💎"
+        source_emoji = "🎯" if source == "betburger" else "💎"
         
         # Build message
         lines = []
+        add = lines.append
         
         # Header with urgency
-        lines.append(f"{urgency_emoji} {source_emoji} **{arb_data.source.upper()} ALERT**")
-        lines.append("")
+        add(_format_header(urgency_emoji, source_emoji, _source_label(source)))
+        add("")
         
         # Event info
         if arb_data.sport:
-            lines.append(f"🏆 **Sport:** {arb_data.sport.title()}")
+            add(f"🏆 **Sport:** {arb_data.sport.title()}")
         
         if arb_data.league:
-            lines.append(f"🏟️ **League:** {arb_data.league}")
+            add(f"🏟️ **League:** {arb_data.league}")
         
         if arb_data.match:
-            lines.append(f"⚽ **Match:** {arb_data.match}")
+            add(f"⚽ **Match:** {arb_data.match}")
         
         if arb_data.market:
             market_text = arb_data.market_details or arb_data.market
-            lines.append(f"📊 **Market:** {market_text}")
+            add(f"📊 **Market:** {market_text}")
         
-        lines.append("")
+        add("")
         
         # Timing info (CRITICAL)
         if arb_data.event_start:
-            lines.append(f"📅 **Event Start:** {arb_data.event_start}")
+            add(f"📅 **Event Start:** {arb_data.event_start}")
         
         minutes = arb_data.minutes_to_start
         if minutes is not None:
             if minutes <= 5:
-                lines.append(f"⏰ **URGENT:** Starts in {minutes} minutes!")
+                add(f"⏰ **URGENT:** Starts in {minutes} minutes!")
             elif minutes <= 60:
-                lines.append(f"⏰ **Time to Start:** {minutes} minutes")
+                add(f"⏰ **Time to Start:** {minutes} minutes")
             else:
                 hours = minutes // 60
                 mins = minutes % 60
-                lines.append(f"⏰ **Time to Start:** {hours}h {mins}m")
+                add(f"⏰ **Time to Start:** {hours}h {mins}m")
         
-        lines.append("")
+        add("")
         
         # Bookmaker info
         if arb_data.selection_a:
-            lines.append(f"🏪 **{arb_data.selection_a.bookmaker.title()}:** {arb_data.selection_a.odd}")
+            add(f"🏪 **{arb_data.selection_a.bookmaker.title()}:** {arb_data.selection_a.odd}")
         
         if arb_data.selection_b:
-            lines.append(f"🏪 **{arb_data.selection_b.bookmaker.title()}:** {arb_data.selection_b.odd}")
+            add(f"🏪 **{arb_data.selection_b.bookmaker.title()}:** {arb_data.selection_b.odd}")
         
-        lines.append("")
+        add("")
         
         # Profit info
         profit = arb_data.profit_percentage
         if profit:
             profit_emoji = "💰" if profit >= 5 else "💵"
             profit_type = "ROI" if arb_data.roi_pct else "Value"
-            lines.append(f"{profit_emoji} **{profit_type}:** {profit:.2f}%")
+            add(f"{profit_emoji} **{profit_type}:** {profit:.2f}%")
         
         if arb_data.stake_recommendation:
-            lines.append(f"💸 **Recommended Stake:** ${arb_data.stake_recommendation:.0f}")
+            add(f"💸 **Recommended Stake:** ${arb_data.stake_recommendation:.0f}")
         
-        lines.append("")
+        add("")
         
         # Links (CRITICAL)
         if arb_data.bookmaker_links:
-            lines.append("🔗 **Direct Links:**")
-            for bookmaker, link in arb_data.bookmaker_links.items():
-                lines.append(f"   • [{bookmaker.title()}]({link})")
+            add("🔗 **Direct Links:**")
+            add("\\n".join(_format_link(bookmaker.title(), link) for bookmaker, link in arb_data.bookmaker_links.items()))
         elif arb_data.target_link:
-            lines.append(f"🔗 [**Open Bet**]({arb_data.target_link})")
+            add(f"🔗 [**Open Bet**]({arb_data.target_link})")
         
-        lines.append("")
+        add("")
         
         # Footer
-        lines.append(f"🏷️ **Profile:** {arb_data.profile}")
+        add(f"🏷️ **Profile:** {arb_data.profile}")
         if arb_data.filter_id:
-            lines.append(f"🔍 **Filter ID:** {arb_data.filter_id}")
+            add(f"🔍 **Filter ID:** {arb_data.filter_id}")
         
-        lines.append(f"⏱️ **Detected:** {datetime.now().strftime('%H:%M:%S')}")
+        sec = int(time.time())
+        ts_sec, ts_str = self._ts_cache
+        if sec != ts_sec:
+            ts_str = datetime.fromtimestamp(sec).strftime('%H:%M:%S')
+            self._ts_cache = (sec, ts_str)
+        add(f"⏱️ **Detected:** {ts_str}")
         
         return "\\n".join(lines)
     
-    async def send_alert_async(self, arb_data, channel_id: str) -> bool:
+    async def send_alert_async(self, arb_data: ArbitrageData, channel_id: str) -> bool:
         """Send alert to Telegram channel asynchronously."""
+        try:
+            message = self.format_arbitrage_message(arb_data)
+        except Exception as e:
+            self._log_error("Failed to format Telegram alert", channel=channel_id, error=str(e))
+            return False
+        return await self._send_raw_async(channel_id, message, arb_data)
+    
+    async def _send_raw_async(self, channel_id: str, message: str, arb_data: ArbitrageData = None) -> bool:
+        """Send an already formatted alert; ``arb_data`` only feeds the logs.
+        
+        Sends to the same channel go out in FIFO order at most once per
+        _PER_CHAT_INTERVAL; different channels overlap, up to
+        _GLOBAL_CONCURRENCY requests in flight.
+        """
         if not self.bot:
             logger.error("Telegram bot not initialized")
             return False
         
+        loop = asyncio.get_running_loop()
+        if loop is not self._pacing_loop:
+            # Locks and semaphores bind to a loop; start over on a new one
+            self._channel_locks.clear()
+            self._global_limit = asyncio.Semaphore(_GLOBAL_CONCURRENCY)
+            self._pacing_loop = loop
+        
+        lock = self._channel_locks.get(channel_id)
+        if lock is None:
+            lock = self._channel_locks[channel_id] = asyncio.Lock()
+        
+        async with lock:
+            delay = self._next_send.get(channel_id, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with self._global_limit:
+                sent = await self._deliver(channel_id, message, arb_data)
+            self._next_send[channel_id] = time.monotonic() + _PER_CHAT_INTERVAL
+        return sent
+    
+    async def _deliver(self, channel_id: str, message: str, arb_data: ArbitrageData = None) -> bool:
+        """Send one formatted alert."""
+        source = getattr(arb_data, "source", None)
         try:
-            message = self.format_arbitrage_message(arb_data)
-            
             await self.bot.send_message(
                 chat_id=channel_id,
                 text=message,
@@ -363,31 +559,25 @@ class TelegramSender:
             logger.info(
                 "Alert sent to Telegram",
                 channel=channel_id,
-                source=arb_data.source,
-                filter_id=arb_data.filter_id,
-                profit=arb_data.profit_percentage
+                source=source,
+                filter_id=getattr(arb_data, "filter_id", None),
+                profit=getattr(arb_data, "profit_percentage", None)
             )
             
             return True
             
         except Exception as e:
-            logger.error(
+            self._log_error(
                 "Failed to send Telegram alert",
                 channel=channel_id,
                 error=str(e),
-                source=arb_data.source
+                source=source
             )
             return False
     
-    def send_alert(self, arb_data, channel_id: str) -> bool:
+    def send_alert(self, arb_data: ArbitrageData, channel_id: str) -> bool:
         """Send alert to Telegram channel (synchronous wrapper)."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_alert_async(arb_data, channel_id))
+        return run_sync(self.send_alert_async(arb_data, channel_id))
     
     async def send_test_message_async(self, channel_id: str, message: str = None) -> bool:
         """Send test message to verify bot works."""
@@ -408,22 +598,18 @@ class TelegramSender:
             return True
             
         except Exception as e:
-            logger.error("Failed to send test message", channel=channel_id, error=str(e))
+            self._log_error("Failed to send test message", channel=channel_id, error=str(e))
             return False
     
     def send_test_message(self, channel_id: str, message: str = None) -> bool:
         """Send test message (synchronous wrapper)."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_test_message_async(channel_id, message))
+        return run_sync(self.send_test_message_async(channel_id, message))
 
 
+def create_sender(bot_token: str = None) -> TelegramSender:
     """Factory function to create Telegram sender."""
     return TelegramSender(bot_token)
+'''
 
 
 # Contenido de pipeline/realtime_processor.py
@@ -435,6 +621,7 @@ based on profile configuration and filters.
 from __future__ import annotations
 
 import os
+import time
 import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -444,7 +631,7 @@ from processors.betburger_parser import BetburgerParser
 from processors.surebet_parser import SurebetParser
 from processors.arbitrage_data import ArbitrageData
 from config.channel_mapper import ChannelMapper
-from notifications.telegram_sender import TelegramSender
+from notifications.telegram_sender import TelegramSender, run_sync
 
 logger = structlog.get_logger(__name__)
 
@@ -461,6 +648,12 @@ class RealtimeProcessor:
         self.betburger_processor = BetburgerParser()
         self.surebet_processor = SurebetParser()
         
+        # (URL marker, source, processor), checked in order
+        self._dispatch = (
+            ("betburger.com", "betburger", self.betburger_processor),
+            ("surebet.com", "surebet", self.surebet_processor),
+        )
+        
         # Stats
         self.processed_count = 0
         self.sent_count = 0
@@ -472,12 +665,9 @@ class RealtimeProcessor:
         """Process a single intercepted request and return arbitrage data."""
         try:
             # Determine source platform
-            if "betburger.com" in url:
-                source = "betburger"
-                processor = self.betburger_processor
-            elif "surebet.com" in url:
-                source = "surebet"
-                processor = self.surebet_processor
+            for marker, source, processor in self._dispatch:
+                if marker in url:
+                    break
             else:
                 logger.warning("Unknown platform in URL", url=url)
                 return []
@@ -503,8 +693,12 @@ class RealtimeProcessor:
             return []
     
     async def send_alerts_async(self, arbitrage_alerts: List[ArbitrageData]) -> int:
-        """Send multiple alerts to appropriate channels asynchronously."""
-        sent_count = 0
+        """Send multiple alerts to appropriate channels asynchronously.
+        
+        Channels are resolved for every alert first; all sends then go out
+        under a single gather so their round-trips overlap.
+        """
+        pairs = []
         
         for arb_data in arbitrage_alerts:
             try:
@@ -526,41 +720,51 @@ class RealtimeProcessor:
                     )
                     continue
                 
-                # Send to all matching channels
-                for channel_id in channels:
-                    success = await self.telegram_sender.send_alert_async(arb_data, channel_id)
-                    if success:
-                        sent_count += 1
-                        logger.info(
-                            "Alert sent successfully",
-                            channel=channel_id,
-                            source=arb_data.source,
-                            profile=arb_data.profile,
-                            profit=arb_data.profit_percentage
-                        )
-                    else:
-                        self.error_count += 1
+                # Format once, reuse the text for every target channel
+                message = self.telegram_sender.format_arbitrage_message(arb_data)
+                pairs.extend((arb_data, channel_id, message) for channel_id in channels)
                         
             except Exception as e:
                 logger.error("Failed to send alert", error=str(e), source=arb_data.source)
                 self.error_count += 1
         
+        # Send every (alert, channel) pair concurrently
+        results = await asyncio.gather(
+            *(
+                self.telegram_sender._send_raw_async(channel_id, message, arb_data)
+                for arb_data, channel_id, message in pairs
+            ),
+            return_exceptions=True,
+        )
+        
+        sent_count = 0
+        for (arb_data, channel_id, _), result in zip(pairs, results):
+            if result is True:
+                sent_count += 1
+                logger.info(
+                    "Alert sent successfully",
+                    channel=channel_id,
+                    source=arb_data.source,
+                    profile=arb_data.profile,
+                    profit=arb_data.profit_percentage
+                )
+            else:
+                self.error_count += 1
+        
         self.sent_count += sent_count
         return sent_count
     
     def send_alerts(self, arbitrage_alerts: List[ArbitrageData]) -> int:
-        """Send alerts synchronously (wrapper for async method)."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_alerts_async(arbitrage_alerts))
+        """Send alerts synchronously (wrapper for async method).
+
+        Raises RuntimeError inside a running event loop: await
+        send_alerts_async there instead.
+        """
+        return run_sync(self.send_alerts_async(arbitrage_alerts))
     
     def process_and_send(self, url: str, response_data: Dict[str, Any], profile: str = None) -> int:
         """Process request and immediately send alerts to Telegram."""
-        start_time = datetime.now()
+        t0 = time.perf_counter_ns()
         
         # Process the request
         arbitrage_alerts = self.process_request(url, response_data, profile)
@@ -572,7 +776,7 @@ class RealtimeProcessor:
         sent_count = self.send_alerts(arbitrage_alerts)
         
         # Calculate latency
-        latency = (datetime.now() - start_time).total_seconds()
+        latency = (time.perf_counter_ns() - t0) / 1e9
         
         logger.info(
             "Process and send completed",
@@ -612,18 +816,23 @@ class RealtimeProcessor:
             if channel_id:
                 all_channels.append((f"support.{support_name}", channel_id))
         
-        # Test each channel
-        for channel_name, channel_id in all_channels:
-            try:
-                success = await self.telegram_sender.send_test_message_async(
-                    channel_id, 
-                    f"🧪 **Test de conectividad**\\n\\nCanal: {channel_name}\\nID: {channel_id}\\n⏱️ {datetime.now().strftime('%H:%M:%S')}"
+        # Test all channels concurrently
+        sent_at = datetime.now().strftime('%H:%M:%S')
+        outcomes = await asyncio.gather(
+            *(
+                self.telegram_sender.send_test_message_async(
+                    channel_id,
+                    f"🧪 **Test de conectividad**\\n\\nCanal: {channel_name}\\nID: {channel_id}\\n⏱️ {sent_at}"
                 )
-                results[channel_name] = success
-                
-            except Exception as e:
-                logger.error("Channel test failed", channel=channel_name, error=str(e))
-                results[channel_name] = False
+                for channel_name, channel_id in all_channels
+            ),
+            return_exceptions=True,
+        )
+        
+        for (channel_name, _), outcome in zip(all_channels, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Channel test failed", channel=channel_name, error=str(outcome))
+            results[channel_name] = outcome is True
         
         return results
     
@@ -640,6 +849,7 @@ class RealtimeProcessor:
 def create_processor(config_path: str = None) -> RealtimeProcessor:
     """Factory function to create real-time processor."""
     return RealtimeProcessor(config_path)
+'''
 
 
 # Contenido de browser/playwright_manager.py
@@ -652,6 +862,7 @@ from __future__ import annotations
 
 import os
 import asyncio
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import structlog
@@ -663,6 +874,28 @@ except ImportError:
 
 logger = structlog.get_logger(__name__)
 
+# Launch/context settings that never change between launches
+_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+_LAUNCH_ARGS = (
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    f"--user-agent={_USER_AGENT}",
+)
+
+# Static assets the interception flows never need
+_BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,woff,woff2,svg,mp4}"
+
+_CONTEXT_OPTIONS = MappingProxyType({
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": _USER_AGENT,
+    "java_script_enabled": True,
+    "accept_downloads": False,
+    "ignore_https_errors": True,
+})
+
 
 class PlaywrightManager:
     """Manages Playwright browser instances with advanced configuration."""
@@ -687,13 +920,7 @@ class PlaywrightManager:
             # Browser launch options
             launch_options = {
                 "headless": self.config.bot.headless_mode,
-                "args": [
-                    "--no-sandbox",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor",
-                    "--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ]
+                "args": _LAUNCH_ARGS,
             }
             
             # Add proxy if configured
@@ -720,15 +947,8 @@ class PlaywrightManager:
                 raise ValueError(f"Unsupported browser engine: {engine}")
             
             # Create context with additional options
-            context_options = {
-                "viewport": {"width": 1920, "height": 1080},
-                "user_agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "java_script_enabled": True,
-                "accept_downloads": False,
-                "ignore_https_errors": True,
-            }
-            
-            self.context = self.browser.new_context(**context_options)
+            self.context = self.browser.new_context(**_CONTEXT_OPTIONS)
+            self.context.route(_BLOCKED_ASSETS, lambda route: route.abort())
             
             # Set default timeout
             self.context.set_default_timeout(self.config.bot.browser_timeout * 1000)
@@ -752,7 +972,8 @@ class PlaywrightManager:
         # Navigate to URL if provided
         if url:
             try:
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                # Return once response headers arrive; interception only needs the requests to fire
+                page.goto(url, wait_until="commit", timeout=30000)
                 logger.info("Navigated to URL", url=url)
             except Exception as e:
                 logger.error("Failed to navigate to URL", url=url, error=str(e))
@@ -812,6 +1033,7 @@ class PlaywrightManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+'''
 
 
 # Contenido de network/playwright_capture.py
@@ -822,10 +1044,13 @@ with intelligent filtering and response processing.
 """
 from __future__ import annotations
 
+import functools
 import json
+import logging
 import re
-from typing import Callable, Optional, Dict, Any, List, Set
+from typing import Callable, Optional, Dict, Any, Iterable, List, Set
 from datetime import datetime
+from urllib.parse import urlsplit
 import structlog
 
 try:
@@ -834,35 +1059,89 @@ except ImportError:
     BrowserContext = Request = Response = None
 
 logger = structlog.get_logger(__name__)
+# stdlib logger backing structlog; used to skip building INFO-only payloads
+_std_logger = logging.getLogger(__name__)
+
+# Bodies larger than this (per Content-Length) are not fetched
+MAX_BODY_BYTES = 1 << 20
+
+# Relevant endpoint paths, one compiled alternation per platform
+_BETBURGER_RE = re.compile(r'/(?:api/|arbs|valuebets|surebets|filters|users/)')
+_SUREBET_RE = re.compile(r'/(?:api/|valuebets|surebets|arbs|users/|filters)')
+
+# Network-layer globs for set_url_globs(); mirror the path patterns above
+DEFAULT_URL_GLOBS = (
+    "**/api/**",
+    "**/arbs**",
+    "**/valuebets**",
+    "**/surebets**",
+    "**/filters**",
+    "**/users/**",
+)
+
+# Registered domain -> path pattern; subdomains (www., es., api.) included
+_DOMAIN_PATTERNS = (
+    ("betburger.com", _BETBURGER_RE),
+    ("surebet.com", _SUREBET_RE),
+)
+
+# Filter ID patterns, tried in order
+_FILTER_ID_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'filter[_-]?id[=:]([^&\\s]+)',
+        r'filterId[=:]([^&\\s]+)',
+        r'filter[=:]([^&\\s]+)',
+        r'/filters/([^/?]+)',
+    )
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _pattern_for_host(host: str) -> Optional[re.Pattern]:
+    """Return the path pattern for a platform host, or None for other hosts."""
+    for domain, pattern in _DOMAIN_PATTERNS:
+        if host == domain or host.endswith("." + domain):
+            return pattern
+    return None
+
+
+# Redirects, retries and subframes repeat the same URL many times
+@functools.lru_cache(maxsize=8192)
+def _relevant_url(url: str) -> bool:
+    """True if the URL is on a platform host and matches its endpoint paths."""
+    # Match on the hostname, not anywhere in the URL
+    pattern = _pattern_for_host(urlsplit(url).hostname or "")
+    return pattern is not None and pattern.search(url) is not None
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_filter_id(url: str) -> Optional[str]:
+    """First filter ID found in the URL, or None."""
+    for pattern in _FILTER_ID_RES:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def clear_url_caches() -> None:
+    """Drop memoized URL checks (they are shared by all captures)."""
+    _relevant_url.cache_clear()
+    _extract_filter_id.cache_clear()
 
 
 class PlaywrightCapture:
     """Captures and processes network requests using Playwright."""
     
-    def __init__(self, context: BrowserContext):
+    def __init__(self, context: BrowserContext, max_body_bytes: int = MAX_BODY_BYTES):
         """Initialize request capture."""
         self.context = context
+        self.max_body_bytes = max_body_bytes
         self.request_handler: Optional[Callable] = None
         self.response_handler: Optional[Callable] = None
-        
-        # Request filtering patterns
-        self.betburger_patterns = [
-            r'/api/',
-            r'/arbs',
-            r'/valuebets',
-            r'/surebets',
-            r'/filters',
-            r'/users/'
-        ]
-        
-        self.surebet_patterns = [
-            r'/api/',
-            r'/valuebets',
-            r'/surebets',
-            r'/arbs',
-            r'/users/',
-            r'/filters'
-        ]
+        self.url_globs: List[str] = []
+        self._request_listener = False
         
         # Statistics
         self.captured_requests = 0
@@ -874,9 +1153,34 @@ class PlaywrightCapture:
     def set_request_handler(self, handler: Callable[[Request], None]):
         """Set handler for captured requests."""
         self.request_handler = handler
-        self.context.on("request", self._handle_request)
+        # With URL globs, requests arrive through the routes instead
+        if not self.url_globs and not self._request_listener:
+            self.context.on("request", self._handle_request)
+            self._request_listener = True
         logger.info("Request handler set")
     
+    def set_url_globs(self, patterns: Iterable[str] = DEFAULT_URL_GLOBS):
+        """Only surface requests matching these globs to Python.
+        
+        Matching requests are routed through _handle_route; the context-wide
+        "request" listener is dropped so other subresources never reach
+        Python. _is_relevant_request still runs as a fallback check.
+        """
+        self.url_globs = list(patterns)
+        for pattern in self.url_globs:
+            self.context.route(pattern, self._handle_route)
+        if self._request_listener:
+            self.context.remove_listener("request", self._handle_request)
+            self._request_listener = False
+        logger.info("URL globs set", globs=self.url_globs)
+    
+    def _handle_route(self, route):
+        """Handle a routed request, then let it through unchanged."""
+        try:
+            self._handle_request(route.request)
+        finally:
+            route.continue_()
+    
     def set_response_handler(self, handler: Callable[[Response, Dict[str, Any]], None]):
         """Set handler for captured responses with JSON data."""
         self.response_handler = handler
@@ -887,7 +1191,6 @@ class PlaywrightCapture:
         """Handle intercepted request."""
         try:
             url = request.url
-            method = request.method
             
             # Filter relevant requests
             if not self._is_relevant_request(url):
@@ -896,12 +1199,14 @@ class PlaywrightCapture:
             
             self.captured_requests += 1
             
-            logger.debug(
-                "Request captured",
-                method=method,
-                url=url,
-                headers=dict(request.headers)
-            )
+            # Copying the headers is only worth it when DEBUG is actually emitted
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request captured",
+                    method=request.method,
+                    url=url,
+                    headers=dict(request.headers)
+                )
             
             # Call custom handler if set
             if self.request_handler:
@@ -912,6 +1217,10 @@ class PlaywrightCapture:
     
     def _handle_response(self, response: Response):
         """Handle intercepted response."""
+        # Nobody consumes the body: don't pull it over CDP
+        if self.response_handler is None:
+            return
+        
         try:
             url = response.url
             status = response.status
@@ -930,21 +1239,26 @@ class PlaywrightCapture:
                 logger.debug("Non-JSON response ignored", url=url, content_type=content_type)
                 return
             
-            # Extract JSON data
+            content_length = int(response.headers.get("content-length") or 0)
+            if content_length > self.max_body_bytes:
+                logger.debug("Oversized response ignored", url=url, content_length=content_length)
+                return
+            
+            # Parse the raw bytes: response.json() decodes to str first,
+            # holding a second full copy of the payload
             try:
-                json_data = response.json()
+                json_data = json.loads(response.body())
                 self.processed_responses += 1
                 
-                logger.info(
-                    "Response captured",
-                    url=url,
-                    status=status,
-                    data_keys=list(json_data.keys()) if isinstance(json_data, dict) else "non-dict"
-                )
+                if _std_logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Response captured",
+                        url=url,
+                        status=status,
+                        data_keys=list(json_data.keys()) if isinstance(json_data, dict) else "non-dict"
+                    )
                 
-                # Call custom handler if set
-                if self.response_handler:
-                    self.response_handler(response, json_data)
+                self.response_handler(response, json_data)
                     
             except Exception as e:
                 logger.debug("Failed to parse JSON response", url=url, error=str(e))
@@ -954,32 +1268,11 @@ class PlaywrightCapture:
     
     def _is_relevant_request(self, url: str) -> bool:
         """Check if request URL matches filtering patterns."""
-        # Check Betburger patterns
-        if "betburger.com" in url:
-            return any(re.search(pattern, url) for pattern in self.betburger_patterns)
-        
-        # Check Surebet patterns
-        if "surebet.com" in url:
-            return any(re.search(pattern, url) for pattern in self.surebet_patterns)
-        
-        return False
+        return _relevant_url(url)
     
     def extract_filter_id(self, url: str) -> Optional[str]:
         """Extract filter ID from URL if present."""
-        # Common patterns for filter IDs
-        patterns = [
-            r'filter[_-]?id[=:]([^&\\s]+)',
-            r'filterId[=:]([^&\\s]+)',
-            r'filter[=:]([^&\\s]+)',
-            r'/filters/([^/?]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return None
+        return _extract_filter_id(url)
     
     def get_stats(self) -> Dict[str, int]:
         """Get capture statistics."""
@@ -995,37 +1288,70 @@ class PlaywrightCapture:
         self.captured_requests = 0
         self.processed_responses = 0
         self.filtered_requests = 0
+        clear_url_caches()
         logger.info("Capture statistics reset")
+'''
 
 
-def create_file(filepath: str, content: str):
-    """Create file with content, creating directories if needed."""
+# Tabla única destino -> plantilla
+TEMPLATES = {
+    "src/config/settings.py": CONFIG_SETTINGS,
+    "src/processors/arbitrage_data.py": ARBITRAGE_DATA,
+    "src/notifications/telegram_sender.py": TELEGRAM_SENDER,
+    "src/pipeline/realtime_processor.py": REALTIME_PROCESSOR,
+    "src/browser/playwright_manager.py": PLAYWRIGHT_MANAGER,
+    "src/network/playwright_capture.py": PLAYWRIGHT_CAPTURE,
+}
+
+# Directorios ya creados en esta ejecución (evita mkdir repetidos)
+_made_dirs: set[str] = set()
+_made_dirs_lock = threading.Lock()
+
+def _ensure_parent(path: Path):
+    """Create path's parent directory once per run (thread-safe)."""
+    parent = path.parent
+    with _made_dirs_lock:
+        if str(parent) in _made_dirs:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        _made_dirs.add(str(parent))
+        _made_dirs.update(str(p) for p in parent.parents)
+
+def create_file(filepath: str, content: str) -> str:
+    """Create file with content, creating directories if needed.
+
+    Returns the status line to print.
+    """
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode('utf-8')
+    
+    # No reescribir si el contenido en disco ya es idéntico
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return f"⏭️  Unchanged: {filepath}"
+    except FileNotFoundError:
+        pass
+    
+    _ensure_parent(path)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Codificar una sola vez y escribir en binario (sin capa de texto)
+    path.write_bytes(data)
     
-    print(f"✅ Created: {filepath}")
+    return f"✅ Created: {filepath}"
 
 def main():
     """Create all missing files."""
     print("🚀 Creating missing files...")
     
-    files_to_create = [
-        ("src/config/settings.py", CONFIG_SETTINGS),
-        ("src/processors/arbitrage_data.py", ARBITRAGE_DATA),
-        ("src/notifications/telegram_sender.py", TELEGRAM_SENDER),
-        ("src/pipeline/realtime_processor.py", REALTIME_PROCESSOR),
-        ("src/browser/playwright_manager.py", PLAYWRIGHT_MANAGER),
-        ("src/network/playwright_capture.py", PLAYWRIGHT_CAPTURE),
-    ]
+    files_to_create = list(TEMPLATES.items())
     
-    for filepath, content in files_to_create:
-        create_file(filepath, content)
+    # Archivos independientes: escribirlos en paralelo (el I/O libera el GIL)
+    with ThreadPoolExecutor(max_workers=min(8, len(files_to_create))) as pool:
+        for status in pool.map(lambda item: create_file(*item), files_to_create):
+            print(status)
     
-    print("\\n✅ All files created successfully!")
-    print("\\nNow run: python scripts/test_imports_debug.py")
+    print("\n✅ All files created successfully!")
+    print("\nNow run: python scripts/test_imports_debug.py")
 
 if __name__ == "__main__":
     main()
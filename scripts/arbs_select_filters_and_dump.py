@@ -22,7 +22,10 @@ from __future__ import annotations
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import List, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -33,14 +36,28 @@ from src.utils.telegram_notifier import TelegramNotifier  # type: ignore
 from src.config.settings import ConfigManager  # type: ignore
 from src.browser.tab_manager import TabManager  # type: ignore
 from src.browser.arbs_sidebar import select_only_filter  # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
 
 logger = get_module_logger("arbs_select_filters_and_dump")
 
+# Background writer for per-tab HTML/PNG artifacts
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
 
 def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+def _write_artifact(path: Path, data) -> None:
+    try:
+        if isinstance(data, str):
+            path.write_text(data, encoding="utf-8")
+        else:
+            path.write_bytes(data)
+    except Exception as e:
+        logger.warning("Failed to write tab artifact", path=str(path), error=str(e))
+
+
 def save_artifacts(driver, out_dir: Path, name: str) -> None:
     ts = time.strftime("%Y%m%d_%H%M%S")
     # HTML goes to raw_html, PNG goes to snapshots
@@ -51,17 +68,70 @@ def save_artifacts(driver, out_dir: Path, name: str) -> None:
     
     html_path = html_dir / f"{name}_{ts}.html"
     png_path = png_dir / f"{name}_{ts}.png"
+    # Capture on this thread (the driver is not thread-safe); write in the background
     try:
-        html_path.write_text(driver.page_source or "", encoding="utf-8")
+        _IO_POOL.submit(_write_artifact, html_path, driver.page_source or "")
     except Exception:
         pass
     try:
-        driver.save_screenshot(str(png_path))
+        _IO_POOL.submit(_write_artifact, png_path, driver.get_screenshot_as_png())
     except Exception:
         pass
     logger.info("Saved tab artifacts", html=str(html_path), screenshot=str(png_path))
 
 
+def _wait_for_arbs_page(driver, timeout: int = 8) -> None:
+    """Wait until the arbs page has finished loading, instead of a fixed sleep."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: "/es/arbs" in (d.current_url or "")
+            and d.execute_script("return document.readyState") == "complete"
+        )
+    except Exception:
+        logger.warning("Arbs page not ready before timeout", timeout=timeout)
+
+
+@dataclass(slots=True, frozen=True)
+class TabCfg:
+    """Filter/channel mapping for one Betburger tab."""
+    profile_key: str
+    filter_name: str
+    channel_id: Optional[str]
+
+
+def _build_tab_configs(cfg: ConfigManager, total: int, yaml_map) -> List[TabCfg]:
+    """Resolve every tab's mapping once: profile key first, then YAML, then legacy env."""
+    env = os.environ
+    tabs: List[TabCfg] = []
+    for i in range(total):
+        profile_key = env.get(f"BETBURGER_TAB_{i+1}_PROFILE_KEY", "").strip()
+        channel_id = None
+        filter_name = ""
+        if profile_key:
+            # New scheme: per-tab profile key selects filter and resolves channel
+            filter_name = env.get(f"BETBURGER_PROFILE_{profile_key}_FILTER", "").strip()
+            try:
+                channel_id = cfg.get_channel_for_profile("betburger", profile_key)
+            except Exception:
+                channel_id = None
+        else:
+            # YAML-driven (list/dict) mapping of filter names
+            if isinstance(yaml_map, list) and i < len(yaml_map):
+                filter_name = str(yaml_map[i] or "").strip()
+            elif isinstance(yaml_map, dict):
+                # keys may be strings or ints representing tab numbers starting at 1
+                key_variants = [i + 1, str(i + 1)]
+                for k in key_variants:
+                    if k in yaml_map:
+                        filter_name = str(yaml_map[k] or "").strip()
+                        break
+            # Legacy env per-tab filter
+            if not filter_name:
+                filter_name = env.get(f"BETBURGER_TAB_{i+1}_FILTER", "").strip()
+        tabs.append(TabCfg(profile_key, filter_name, channel_id))
+    return tabs
+
+
 def main() -> int:
     cfg = ConfigManager()
     bot = cfg.bot
@@ -89,39 +159,19 @@ def main() -> int:
         notifier = TelegramNotifier()
         send_alerts = os.getenv("ARBS_SEND_OPEN_ALERTS", "true").lower() != "false"
 
+        tab_cfgs = _build_tab_configs(cfg, total, yaml_map)
+        support_chat = cfg.get_support_channel()
+
         for i in range(total):
             tm.driver.switch_to.window(handles[i])
             time.sleep(0.4)
             # Defensive: ensure we are on /es/arbs
             if "/es/arbs" not in (tm.driver.current_url or ""):
                 tm.driver.get("https://www.betburger.com/es/arbs")
-                time.sleep(1.0)
-
-            # Determine mapping based on profile key first, then YAML, then legacy env
-            profile_key = os.environ.get(f"BETBURGER_TAB_{i+1}_PROFILE_KEY", "").strip()
-            channel_id = None
-            filter_name = ""
-            if profile_key:
-                # New scheme: per-tab profile key selects filter and resolves channel
-                filter_name = os.environ.get(f"BETBURGER_PROFILE_{profile_key}_FILTER", "").strip()
-                try:
-                    channel_id = cfg.get_channel_for_profile("betburger", profile_key)
-                except Exception:
-                    channel_id = None
-            else:
-                # YAML-driven (list/dict) mapping of filter names
-                if isinstance(yaml_map, list) and i < len(yaml_map):
-                    filter_name = str(yaml_map[i] or "").strip()
-                elif isinstance(yaml_map, dict):
-                    # keys may be strings or ints representing tab numbers starting at 1
-                    key_variants = [i + 1, str(i + 1)]
-                    for k in key_variants:
-                        if k in yaml_map:
-                            filter_name = str(yaml_map[k] or "").strip()
-                            break
-                # Legacy env per-tab filter
-                if not filter_name:
-                    filter_name = os.environ.get(f"BETBURGER_TAB_{i+1}_FILTER", "").strip()
+                _wait_for_arbs_page(tm.driver)
+
+            tab = tab_cfgs[i]
+            profile_key, filter_name, channel_id = tab.profile_key, tab.filter_name, tab.channel_id
             if not filter_name:
                 logger.warning("No filter configured for tab", tab=i+1)
             else:
@@ -139,7 +189,7 @@ def main() -> int:
                 # Notify channel regardless of success/failure
                 if send_alerts:
                     # Prefer resolved channel_id for the profile; fallback to support channel
-                    target_chat = channel_id or cfg.get_support_channel()
+                    target_chat = channel_id or support_chat
                     if target_chat:
                         if ok:
                             msg = (
@@ -162,7 +212,7 @@ def main() -> int:
             
             # Send capture success message if alerts enabled
             if send_alerts:
-                target_chat = channel_id or cfg.get_support_channel()
+                target_chat = channel_id or support_chat
                 if target_chat:
                     capture_msg = (
                         f"📸 Betburger: captura guardada - pestaña {i+1}\n"
@@ -176,8 +226,8 @@ def main() -> int:
         return 0
 
     finally:
-        # Keep session open for manual review
-        pass
+        # Flush pending artifact writes; keep session open for manual review
+        _IO_POOL.shutdown(wait=True)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,9 @@ Headless login script for Betburger using Playwright (Python).
 
 - Reads credentials from .env: BETBURGER_EMAIL, BETBURGER_PASSWORD
 - Uses persistent user data dir at logs/playwright_profile to store cookies/session
+- Dumps the logged-in session to logs/playwright_profile/storage_state.json so
+  other runs can restore it with new_context(storage_state=...); PlaywrightManager
+  ignores it once older than STORAGE_STATE_MAX_AGE_H or holding expired cookies
 - Navigates to login page, submits credentials, and verifies login by
   redirect or disappearance of the login form.
 
@@ -22,12 +25,18 @@ from __future__ import annotations
 import os
 import sys
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+# Keep in sync with src/browser/playwright_manager.STORAGE_STATE_FILE
+STORAGE_STATE_FILE = "storage_state.json"
+
 
 def load_env_file(env_path: Path) -> None:
     """Lightweight loader for KEY=VALUE pairs from a .env file if present.
@@ -84,6 +93,43 @@ def guess_login_urls(base: str) -> list[str]:
     return uniq
 
 
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None  # surface the 3xx as an HTTPError instead of following it
+
+
+_PROBE_OPENER = urllib.request.build_opener(_NoRedirect)
+_PROBE_TIMEOUT_S = 1.5
+
+
+def _probe_login_url(url: str) -> bool:
+    """HEAD ``url``; 2xx and 3xx both count as a live login page."""
+    req = urllib.request.Request(url, method="HEAD")
+    try:
+        with _PROBE_OPENER.open(req, timeout=_PROBE_TIMEOUT_S) as resp:
+            return resp.status < 400
+    except urllib.error.HTTPError as e:
+        return e.code < 400
+    except Exception:
+        return False
+
+
+def order_login_urls(urls: list[str]) -> list[str]:
+    """Move the first candidate that answers a HEAD request to the front.
+
+    All candidates are probed at once with a short timeout, so the probe costs
+    at most one slow round-trip. Redirects (e.g. to a localized login page)
+    count as a hit. When nothing answers the original order is kept, and the
+    remaining candidates stay as fallbacks.
+    """
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        hits = list(pool.map(_probe_login_url, urls))
+    for url, hit in zip(urls, hits):
+        if hit:
+            return [url] + [u for u in urls if u != url]
+    return urls
+
+
 def wait_for_login_success(page, login_url: str, arbs_url: str, timeout_ms: int = 20000) -> bool:
     """Heuristics to detect successful login.
     - Either we navigate away from login_url to arbs_url or any non-login page
@@ -137,6 +183,8 @@ def do_login(username_or_email: str, password: str, base_url: str, arbs_path: st
         )
         try:
             page = context.pages[0] if context.pages else context.new_page()
+            if len(login_urls) > 1:
+                login_urls = order_login_urls(login_urls)
 
             # Try candidate login URLs until we find the form
             found_form = False
@@ -234,6 +282,14 @@ def do_login(username_or_email: str, password: str, base_url: str, arbs_path: st
             except Exception:
                 pass
 
+            # Portable session dump: later contexts load this instead of the full profile
+            state_path = user_data_dir / STORAGE_STATE_FILE
+            try:
+                context.storage_state(path=str(state_path))
+                log("info", "Saved storage state", path=str(state_path))
+            except Exception as e:
+                log("warning", "Could not save storage state", error=str(e))
+
             log("info", "Login completed and session persisted.")
             return 0
         finally:
@@ -17,12 +17,14 @@ Notes:
 from __future__ import annotations
 
 import os
-import re
 import sys
-import time
 import json
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from urllib.parse import urlparse
 
 # Imports setup
@@ -30,7 +32,6 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from bs4 import BeautifulSoup  # type: ignore
 from selenium.webdriver.common.by import By  # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
 from selenium.webdriver.support import expected_conditions as EC  # type: ignore
@@ -38,14 +39,21 @@ from selenium.webdriver.support import expected_conditions as EC  # type: ignore
 from src.utils.logger import get_module_logger  # type: ignore
 from src.config.settings import ConfigManager  # type: ignore
 from src.browser.tab_manager import TabManager  # type: ignore
-from src.utils.telegram_notifier import TelegramNotifier  # type: ignore
-from src.browser.betburger_nav import get_selected_saved_filter_name  # type: ignore
-from src.utils.snapshots import write_snapshot, read_snapshot, compute_hash  # type: ignore
+from src.utils.telegram_notifier import TelegramNotifier, send_outbox  # type: ignore
+from src.browser.betburger_nav import (  # type: ignore
+    HAS_ROWS_JS,
+    PAGE_JS,
+    READY_JS,
+    get_selected_saved_filter_name,
+    wait_until,
+)
+from src.utils.snapshots import write_snapshot  # type: ignore
 from scripts.smoke_betburger_arbs_tabs import (
     login_with_remember_me,
     duplicate_tabs_to,
 )  # type: ignore
 from scripts.process_snapshots import process_file as process_snapshot_file  # type: ignore
+from src.parsers.betburger_html import extract_rows as _extract_rows  # type: ignore
 from src.formatters.message_templates import EventCard, Selection, format_surebet_card  # type: ignore
 from src.processing.required_fields import (
     get_required_fields,
@@ -55,8 +63,78 @@ from src.snapshots.snapshot_manager import save_html_snapshot  # type: ignore
 from src.network.betburger_extract import extract_tokens_from_request  # type: ignore
 from src.ocr.ocr_utils import ocr_webelement  # type: ignore
 
+# orjson parses the latest.json bytes directly, without a str decode first
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_module_logger("betburger_send_all_tabs_results")
 
+_ARBS_URL = "https://www.betburger.com/es/arbs"
+
+# Row parsing and /label snapshot writes for one tab overlap the Selenium work on the next
+_PARSE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# blake2b digest of the last page delivered per (tab number, profile); survives
+# across send_all_tabs_with_driver calls so looping runners skip quiet tabs.
+# Keyed by tab too: two tabs may resolve to the same profile.
+_last_page_hash: dict[tuple, bytes] = {}
+# Browser-side hash of each tab's last delivered visible text: an unchanged
+# tab is skipped before the page is pruned, serialized and sent over the wire
+_last_fingerprint: dict[tuple, str] = {}
+
+# Parsed rows for the last few distinct pages, keyed by that same digest:
+# tabs showing the same filter share one parse. Small, so no HTML is pinned
+# for long; the lock covers the two _PARSE_POOL workers.
+_ROWS_CACHE_SIZE = 8
+_rows_by_hash: "OrderedDict[tuple, tuple]" = OrderedDict()
+_rows_lock = threading.Lock()
+
+# Same check as '"%" in driver.page_source', evaluated in the browser so only
+# a boolean crosses the WebDriver wire on each poll
+_HAS_PERCENT_JS = "return document.documentElement.outerHTML.includes('%');"
+# Saved-filters menu triggers for _apply_ui_filter, tried in order; CSS where
+# the match is structural, XPath where it needs the button text
+_UI_FILTER_TRIGGERS = (
+    (By.XPATH, "//button[contains(., 'Saved') or contains(., 'Guardados') or contains(., 'Filtros')]"),
+    (By.CSS_SELECTOR, "div[class*='filters'] button"),
+    (By.XPATH, "//span[contains(., 'Saved') or contains(., 'Guardados')]/ancestor::button[1]"),
+)
+# Visible saved-filter option whose text is exactly arguments[0] (XPath
+# normalize-space rules): first an <li> holding such a text node, else an
+# li/div/a whose whole text matches. Returns the element or null.
+_FIND_FILTER_OPTION_JS = r"""
+var name = arguments[0];
+function norm(s) { return s.replace(/[ \t\r\n]+/g, ' ').replace(/^ | $/g, ''); }
+function shown(e) { return e.getClientRects().length > 0; }
+var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+for (var t = walker.nextNode(); t; t = walker.nextNode()) {
+    if (norm(t.nodeValue) !== name) continue;
+    var li = null;
+    for (var e = t.parentElement; e; e = e.parentElement) {
+        if (e.tagName === 'LI') li = e;
+    }
+    if (li) {
+        if (shown(li)) return li;
+        break;
+    }
+}
+var els = document.querySelectorAll('li, div, a');
+for (var i = 0; i < els.length; i++) {
+    if (norm(els[i].textContent) === name) return shown(els[i]) ? els[i] : null;
+}
+return null;
+"""
+# FNV-1a over the visible text plus its length; only this short string crosses
+# the wire. Counts/lengths alone would miss odds changing in place (1.5% -> 2.1%)
+_FINGERPRINT_JS = r"""
+var t = document.body ? document.body.innerText : '';
+var h = 0x811c9dc5;
+for (var i = 0; i < t.length; i++) { h = Math.imul(h ^ t.charCodeAt(i), 16777619); }
+return (h >>> 0).toString(16) + ':' + t.length;
+"""
+
 
 def _safe_parse_dt(val: Optional[str]):
     """Parse ISO-like string (supports trailing 'Z') to aware UTC datetime or None."""
@@ -75,79 +153,6 @@ def _safe_parse_dt(val: Optional[str]):
         return None
 
 
-def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
-    """Extract top arbitrage/valuebet rows from Betburger listing."""
-    soup = BeautifulSoup(html, "lxml")
-    percent_re = re.compile(r"\b\d{1,2}(?:[\.,]\d{1,2})?\s*%\b")
-
-    candidates = []
-    for tag in soup.find_all(string=percent_re):
-        try:
-            el = tag.parent
-            row = el
-            for _ in range(4):
-                if row and row.name in ("li", "tr", "div") and (row.find_all("a") or row.find_all("span")):
-                    break
-                row = row.parent
-            if not row:
-                continue
-            text = " ".join(row.get_text(" ", strip=True).split())
-            candidates.append((row, text))
-        except Exception:
-            continue
-
-    # Unique by text
-    seen = set()
-    uniq = []
-    for row, text in candidates:
-        key = text.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append((row, text))
-
-    items = []
-    for row, text in uniq[: max_items * 2]:
-        try:
-            m_pct = percent_re.search(text)
-            percent = m_pct.group(0) if m_pct else ""
-
-            # Match name: contains ' vs ' or ' - '
-            m_match = re.search(r"([A-Za-z0-9\.\-\'\s]+\svs\s[A-Za-z0-9\.\-\'\s]+)|([A-Za-z0-9\.\-\'\s]+\s-\s[A-Za-z0-9\.\-\'\s]+)", text)
-            match_name = m_match.group(0) if m_match else ""
-
-            # Sport header near the row
-            sport = ""
-            try:
-                head = row.find_previous(lambda t: t.name in ("h1","h2","h3","div","span") and any(k in t.get_text() for k in ("Fútbol","Football","Tenis","Tennis")))
-                if head:
-                    sport = head.get_text(" ", strip=True)
-            except Exception:
-                pass
-
-            # Bookmakers and odds
-            books = []
-            for bk, odd in re.findall(r"([A-Za-z][A-Za-z0-9_\-\.]{2,})\s*[:\-]?\s*(\d{1,3}[\.,]\d{1,2})", text):
-                books.append(f"{bk}:{odd}")
-            books_line = ", ".join(books[:3])
-
-            # Meta time/league hints
-            m_time = re.search(r"\b\d{1,2}[:h]\d{2}\b|\b\d+\s*(min|minutes?)\b", text, flags=re.I)
-            meta = m_time.group(0) if m_time else ""
-
-            items.append({
-                "sport": sport,
-                "match": match_name,
-                "percent": percent,
-                "books": books_line,
-                "meta": meta,
-            })
-        except Exception:
-            continue
-
-    return items[:max_items]
-
-
 def _apply_ui_filter(driver, filter_name: str, timeout: int = 15) -> bool:
     """Best-effort: select a saved filter in Betburger UI by exact visible text.
 
@@ -160,15 +165,10 @@ def _apply_ui_filter(driver, filter_name: str, timeout: int = 15) -> bool:
         wait = WebDriverWait(driver, timeout)
         # 1) Open saved filters dropdown/menu
         # Try multiple triggers (button/icon/text)
-        triggers = [
-            "//button[contains(., 'Saved') or contains(., 'Guardados') or contains(., 'Filtros')]",
-            "//div[contains(@class,'filters')]//button",
-            "//span[contains(., 'Saved') or contains(., 'Guardados')]/ancestor::button[1]",
-        ]
         opened = False
-        for xp in triggers:
+        for locator in _UI_FILTER_TRIGGERS:
             try:
-                el = wait.until(EC.element_to_be_clickable((By.XPATH, xp)))
+                el = wait.until(EC.element_to_be_clickable(locator))
                 driver.execute_script("arguments[0].click();", el)
                 opened = True
                 break
@@ -181,44 +181,102 @@ def _apply_ui_filter(driver, filter_name: str, timeout: int = 15) -> bool:
             except Exception:
                 pass
 
-        # 2) Click the option by text
-        option_xps = [
-            f"//li[.//text()[normalize-space()='{filter_name}']]",
-            f"//*[self::li or self::div or self::a][normalize-space()='{filter_name}']",
-        ]
-        for oxp in option_xps:
-            try:
-                opt = wait.until(EC.element_to_be_clickable((By.XPATH, oxp)))
-                driver.execute_script("arguments[0].click();", opt)
-                # 3) Wait for content refresh: percent blocks reload
-                try:
-                    wait.until(lambda d: "%" in (d.page_source or ""))
-                except Exception:
-                    pass
-                return True
-            except Exception:
-                continue
+        # 2) Click the option by text: both matching rules are checked in the
+        # browser on each poll, so a miss on the first no longer costs a timeout
+        try:
+            opt = wait.until(lambda d: d.execute_script(_FIND_FILTER_OPTION_JS, filter_name))
+        except Exception:
+            return False
+        driver.execute_script("arguments[0].click();", opt)
+        # 3) Wait for content refresh: percent blocks reload
+        try:
+            wait.until(lambda d: d.execute_script(_HAS_PERCENT_JS))
+        except Exception:
+            pass
+        return True
     except Exception:
         return False
-    return False
+
+
+# Summary row: "<n>. <sport> <match>" then "<percent>  <books>  <meta>"
+_format_row = "{}. {} {}\n   {}  {}  {}".format
+_ROW_KEYS = ("sport", "match", "percent", "books", "meta")
 
 
 def _format_summary(items: List[dict], tab_num: int, profile_key: str) -> str:
-    lines = [f"📢 Betburger | Pestaña {tab_num} ({profile_key})"]
+    header = f"📢 Betburger | Pestaña {tab_num} ({profile_key})"
     if not items:
-        lines.append("No se detectaron eventos visibles.")
-        return "\n".join(lines)
-    for i, it in enumerate(items, 1):
-        lines.append(
-            f"{i}. {it.get('sport') or ''} {it.get('match') or ''}\n   {it.get('percent') or ''}  {it.get('books') or ''}  {it.get('meta') or ''}"
-        )
-    return "\n".join(lines)
+        return f"{header}\nNo se detectaron eventos visibles."
+    body = "\n".join(
+        _format_row(i, *[it.get(k) or "" for k in _ROW_KEYS]) for i, it in enumerate(items, 1)
+    )
+    return f"{header}\n{body}"
+
+
+def _cached_rows(page_hash: bytes, html: str, max_items: int = 5) -> List[dict]:
+    """_extract_rows(html) memoized by the page digest."""
+    key = (page_hash, max_items)
+    with _rows_lock:
+        rows = _rows_by_hash.get(key)
+        if rows is not None:
+            _rows_by_hash.move_to_end(key)
+            return list(rows)
+    rows = tuple(_extract_rows(html, max_items=max_items))
+    with _rows_lock:
+        _rows_by_hash[key] = rows
+        while len(_rows_by_hash) > _ROWS_CACHE_SIZE:
+            _rows_by_hash.popitem(last=False)
+    return list(rows)
+
+
+def _tab_summary(
+    html: str,
+    page_hash: bytes,
+    tab_num: int,
+    profile_key: str,
+    dbg: str,
+) -> tuple:
+    """Build one tab's summary text and item count (runs on _PARSE_POOL)."""
+    items = _cached_rows(page_hash, html, max_items=5)
+    return _format_summary(items, tab_num, profile_key) + dbg, len(items)
+
+
+def _resolve_summaries(outbox: List[tuple]) -> List[tuple]:
+    """Wait for background summaries, keeping each entry's place in tab order."""
+    ready = []
+    for target, text, event, fields in outbox:
+        if isinstance(text, Future):
+            try:
+                text, fields["items"] = text.result()
+            except Exception as e:
+                logger.error("Failed to build tab summary", error=str(e), **fields)
+                continue
+        ready.append((target, text, event, fields))
+    return ready
+
+
+def _start_tab_loads(driver, handles: List[str]) -> Optional[str]:
+    """Begin loading the arbs page in every tab not already on it, without waiting.
+
+    Tabs are visited last to first so the driver ends on the first one; returns
+    the handle it is left on (None if no switch succeeded).
+    """
+    focused = None
+    for handle in reversed(handles):
+        try:
+            driver.switch_to.window(handle)
+            focused = handle
+            if "/es/arbs" not in (driver.current_url or ""):
+                driver.execute_script("window.location.assign(arguments[0]);", _ARBS_URL)
+        except Exception as e:
+            logger.debug("Could not start tab load", error=str(e))
+    return focused
 
 
 def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
     """Send summaries for all Betburger tabs using an existing Selenium driver.
 
-    Returns 0 on success (>=1 tab sent), 1 otherwise.
+    Returns 0 on success (>=1 tab sent, or every tab unchanged), 1 otherwise.
     """
     try:
         handles = driver.window_handles
@@ -233,8 +291,12 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
         # Snapshot configuration (shared with Surebet):
         snapshot_enabled = (os.environ.get("SNAPSHOT_ENABLED", "false").lower() == "true")
         snapshot_dir = Path(os.environ.get("SNAPSHOT_DIR", str(ROOT / "logs" / "html")))
-        success_count = 0
-        last_hash_by_profile: dict[str, str] = {}
+        # (target, text or pending summary, log event, log fields) per tab, sent after the loop
+        outbox: list[tuple] = []
+        # (fingerprint, page hash) per queued (tab, profile); cached only once its message is
+        # delivered, so a tab whose summary fails to build or send is retried on the next pass
+        pending_marks: dict[tuple, tuple] = {}
+        quiet_tabs = 0
 
         # Build UI filter name -> profile mapping from YAML
         yaml_profiles_map = (cfg.channels.get("betburger_profiles") or {})
@@ -247,21 +309,52 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
             except Exception:
                 continue
 
+        # One WebDriver session drives one window at a time, so tabs cannot be
+        # worked from threads; start the page loads together instead so they
+        # overlap rather than blocking one driver.get() per tab below.
+        focused = _start_tab_loads(driver, handles[:actual_tabs])
+
+        # Per-tab env fallbacks and the support channel, read once rather than inside the loop
+        configured_profiles = [
+            os.getenv(f"BETBURGER_TAB_{n}_PROFILE_KEY", "").strip() for n in range(1, actual_tabs + 1)
+        ]
+        support_chat = cfg.get_support_channel()
+        # latest.json path per profile a tab can resolve to (UI mapping or env key)
+        parsed_dir = Path(os.getenv("PARSED_OUTPUT_DIR", str(ROOT / "logs" / "snapshots_parsed")))
+        latest_paths = {
+            pk: parsed_dir / f"betburger-{pk}-latest.json"
+            for pk in {*ui_to_profile.values(), *configured_profiles} if pk
+        }
+        # Config is fixed for the run: resolve each profile's lookups once, not per tab
+        profile_cfg = {
+            pk: {
+                "target": cfg.get_channel_for_profile("betburger", pk) or support_chat,
+                "ui_filter": cfg.get_profile_ui_filter_name("betburger", pk),
+                "defaults": cfg.get_profile_defaults("betburger", pk) or {},
+                "required": get_required_fields(cfg, "betburger", pk),
+            }
+            for pk in latest_paths
+        }
+        browser_timeout = cfg.bot.browser_timeout
+
         for i in range(actual_tabs):
             tab_num = i + 1
             logger.info(f"Processing tab {tab_num}/{actual_tabs}")
 
             try:
-                driver.switch_to.window(handles[i])
-                time.sleep(0.5)
+                # Each switch is a WebDriver round-trip; skip it when already there
+                if focused != handles[i]:
+                    driver.switch_to.window(handles[i])
+                    focused = handles[i]
+                wait_until(driver, READY_JS, 3)
 
                 # Ensure we're on /es/arbs
                 if "/es/arbs" not in (driver.current_url or ""):
-                    driver.get("https://www.betburger.com/es/arbs")
-                    time.sleep(1.0)
+                    driver.get(_ARBS_URL)
+                    wait_until(driver, READY_JS, 10)
 
                 # Get profile from ENV (fallback) but prefer UI-detected filter mapping
-                configured_profile = os.getenv(f"BETBURGER_TAB_{tab_num}_PROFILE_KEY", "").strip()
+                configured_profile = configured_profiles[i]
                 # If a default UI filter is set for configured profile, we may apply it; but
                 # the final profile selection should prefer what the UI currently shows.
                 ui_selected = get_selected_saved_filter_name(driver) or ""
@@ -272,51 +365,67 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
                     )
                     continue
 
-                channel_id = cfg.get_channel_for_profile("betburger", profile_key)
-                target = channel_id or cfg.get_support_channel()
+                prof_cfg = profile_cfg[profile_key]
+                target = prof_cfg["target"]
                 if not target:
                     logger.warning(f"No target channel for tab {tab_num} profile {profile_key}")
                     continue
 
                 # Apply saved UI filter if configured for this profile
                 try:
-                    ui_filter = cfg.get_profile_ui_filter_name("betburger", profile_key)
-                    if ui_filter:
-                        applied = _apply_ui_filter(driver, ui_filter, timeout=cfg.bot.browser_timeout)
+                    ui_filter = prof_cfg["ui_filter"]
+                    # Already showing it: skip the menu clicks and the content-refresh wait
+                    if ui_filter and ui_filter.strip() == ui_selected.strip():
+                        logger.info("UI filter already selected", tab=tab_num, profile=profile_key, ui_filter=ui_filter)
+                    elif ui_filter:
+                        applied = _apply_ui_filter(driver, ui_filter, timeout=browser_timeout)
                         logger.info("Applied UI filter", tab=tab_num, profile=profile_key, ui_filter=ui_filter, applied=applied)
-                        time.sleep(0.5)
                 except Exception as fe:
                     logger.warning("Failed applying UI filter; continuing", error=str(fe), tab=tab_num, profile=profile_key)
 
                 # Extract and send results (and optionally save snapshot)
-                time.sleep(1.0)  # Allow content to render
-                html = driver.page_source or ""
+                # Allow content to render: wait for visible percent figures (rows), not a fixed delay
+                wait_until(driver, HAS_ROWS_JS, 3)
+                # Same visible text as the last pass: skip before fetching the page
+                try:
+                    fingerprint = driver.execute_script(_FINGERPRINT_JS) or ""
+                except Exception:
+                    fingerprint = ""
+                mark_key = (tab_num, profile_key)
+                if fingerprint and _last_fingerprint.get(mark_key) == fingerprint:
+                    logger.info("Fingerprint unchanged; skipping send", tab=tab_num, profile=profile_key)
+                    quiet_tabs += 1
+                    continue
+                html = driver.execute_script(PAGE_JS) or ""
+                # Encoded once: hashed here and, with snapshots on, written as is
+                html_bytes = html.encode("utf-8", "ignore")
+                # Unchanged page since the last pass for this tab: nothing new to send
+                page_hash = hashlib.blake2b(html_bytes, digest_size=16).digest()
+                if _last_page_hash.get(mark_key) == page_hash:
+                    logger.info("Page unchanged since last pass; skipping send", tab=tab_num, profile=profile_key)
+                    quiet_tabs += 1
+                    continue
+                pending_marks[mark_key] = (fingerprint, page_hash)
                 html_to_parse = html
                 if snapshot_enabled:
                     try:
-                        path = write_snapshot(html, snapshot_dir, "betburger", profile_key)
-                        disk_html = read_snapshot(snapshot_dir, "betburger", profile_key) or html
-                        snap_hash = compute_hash(disk_html)
-                        if last_hash_by_profile.get(profile_key) == snap_hash:
-                            logger.info("No changes since last snapshot; skipping send", tab=tab_num, profile=profile_key)
-                            continue
-                        last_hash_by_profile[profile_key] = snap_hash
+                        # The page hash above already covers change detection, and the
+                        # file holds exactly `html`: no read-back or second hash needed
+                        path = write_snapshot(html_bytes, snapshot_dir, "betburger", profile_key)
                         logger.info("Saved Betburger snapshot", file=str(path), tab=tab_num, profile=profile_key)
 
                         # Process snapshot -> JSON latest
                         try:
-                            process_snapshot_file(Path(path), source="betburger", profile=profile_key)
+                            process_snapshot_file(Path(path), source="betburger", profile=profile_key, html=html)
                         except Exception as pe:
                             logger.warning("Failed processing snapshot to JSON; will fallback to HTML parsing", error=str(pe))
                         # Build message from latest JSON if available
-                        parsed_dir = Path(os.getenv("PARSED_OUTPUT_DIR", str(ROOT / "logs" / "snapshots_parsed")))
-                        latest = parsed_dir / f"betburger-{profile_key}-latest.json"
+                        latest = latest_paths[profile_key]
                         if latest.exists():
                             try:
-                                data = json.loads(latest.read_text(encoding="utf-8", errors="ignore"))
+                                data = _json_loads(latest.read_bytes())
                                 # Validate against required fields for this profile
-                                req = get_required_fields(cfg, "betburger", profile_key)
-                                valid, missing = validate_alert_fields(data, req)
+                                valid, missing = validate_alert_fields(data, prof_cfg["required"])
                                 if not valid:
                                     logger.info(
                                         "Skipping send: missing required fields",
@@ -324,12 +433,11 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
                                         profile=profile_key,
                                         tab=tab_num,
                                     )
-                                    time.sleep(0.2)
                                     continue
                                 # Build formatted EventCard using unified formatter
                                 sel_a = data.get("selection_a") or {}
                                 sel_b = data.get("selection_b") or {}
-                                defaults = cfg.get_profile_defaults("betburger", profile_key) or {}
+                                defaults = prof_cfg["defaults"]
                                 def_a = (defaults.get("selection_a") or {})
                                 def_b = (defaults.get("selection_b") or {})
                                 def_market = defaults.get("market_label") or ""
@@ -367,19 +475,13 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
                                         text = text + dbg
                                     except Exception:
                                         pass
-                                ok = notifier.send_text(text, chat_id=target)
-                                logger.info(
-                                    f"Tab {tab_num} JSON-based message sent", ok=ok, target=target, profile=profile_key
-                                )
-                                if ok:
-                                    success_count += 1
-                                time.sleep(0.5)
+                                outbox.append((target, text, f"Tab {tab_num} JSON-based message sent", {"tab": tab_num, "profile": profile_key}))
                                 continue  # Done with this tab
                             except Exception as je:
                                 logger.warning("Failed to read/format latest JSON; fallback to HTML parsing", error=str(je))
 
-                        # If no latest JSON, fallback to parsing the disk_html
-                        html_to_parse = disk_html
+                        # If no latest JSON, fallback to parsing the snapshot HTML
+                        html_to_parse = html
                     except Exception as e:
                         logger.warning("Failed to save/read Betburger snapshot; parsing from memory", error=str(e), tab=tab_num, profile=profile_key)
                         html_to_parse = html
@@ -467,33 +569,29 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
                     logger.warning("OCR capture failed (non-fatal)", error=str(oe), tab=tab_num)
 
                 # Fallback path (snapshots disabled or JSON not available): send summary from HTML
-                items = _extract_rows(html_to_parse, max_items=5)
-                text = _format_summary(items, tab_num, profile_key)
                 # Append temporary debug lines if enabled
+                dbg = ""
                 if os.environ.get("DEBUG_ROUTE_HINTS", "false").lower() == "true":
                     try:
                         lf = net_meta.get("last_filter_id")
                         sigs = ", ".join((net_meta.get("signals") or [])[:5])
                         ocr_part = f"\n[debug] OCR: {ocr_text[:200]}" if ocr_text else ""
                         dbg = f"\n\n[debug] Id detectado: {lf}\n[debug] Filtro detectado: {profile_key} (UI: {ui_selected})\n[debug] Señales: {sigs}{ocr_part}"
-                        text = text + dbg
                     except Exception:
                         pass
 
-                ok = notifier.send_text(text, chat_id=target)
-                logger.info(
-                    f"Tab {tab_num} summary sent", ok=ok, target=target, items=len(items), profile=profile_key
+                # Parse in the background while the driver moves on to the next tab
+                summary = _PARSE_POOL.submit(
+                    _tab_summary, html_to_parse, page_hash, tab_num, profile_key, dbg
                 )
-
-                if ok:
-                    success_count += 1
-
-                time.sleep(0.5)  # Brief pause between tabs
+                outbox.append((target, summary, f"Tab {tab_num} summary sent", {"tab": tab_num, "profile": profile_key}))
 
                 # --- Save HTML snapshot en snapshot_manager para habilitar /label ---
+                # Pure disk I/O (it never raises): write it in the background too
                 try:
                     cur_url = driver.current_url or ""
-                    save_html_snapshot(
+                    _PARSE_POOL.submit(
+                        save_html_snapshot,
                         platform="betburger",
                         tab_id=tab_num,
                         html=html_to_parse,
@@ -514,8 +612,21 @@ def send_all_tabs_with_driver(driver, cfg: ConfigManager) -> int:
                 logger.error(f"Error processing tab {tab_num}", error=str(e))
                 continue
 
-        logger.info(f"Completed processing all tabs", success=success_count, total=actual_tabs)
-        return 0 if success_count > 0 else 1
+        # Messages are sent once every tab has been read
+        ready = _resolve_summaries(outbox)
+        delivered = send_outbox(notifier, ready)
+        for (_target, _text, _event, fields), ok in zip(ready, delivered):
+            mark_key = (fields.get("tab"), fields.get("profile"))
+            marks = pending_marks.get(mark_key) if ok else None
+            if marks:
+                fingerprint, page_hash = marks
+                if fingerprint:
+                    _last_fingerprint[mark_key] = fingerprint
+                _last_page_hash[mark_key] = page_hash
+        success_count = sum(delivered)
+        logger.info(f"Completed processing all tabs", success=success_count, quiet=quiet_tabs, total=actual_tabs)
+        # Nothing changed anywhere is a normal quiet pass, not a failure
+        return 0 if success_count > 0 or (quiet_tabs and not outbox) else 1
 
     except Exception as outer:
         logger.error("Unhandled error in send_all_tabs_with_driver", error=str(outer))
@@ -540,8 +651,8 @@ def _prepare_tabs_if_needed(tm: TabManager, cfg: ConfigManager, desired_tabs: in
                 logger.warning("Login attempt failed; will try to navigate directly", error=str(e))
 
         # Navigate to arbs page
-        tm.driver.get("https://www.betburger.com/es/arbs")
-        time.sleep(1.0)
+        tm.driver.get(_ARBS_URL)
+        wait_until(tm.driver, READY_JS, 10)
 
         # Duplicate to desired count
         duplicate_tabs_to(tm.driver, desired_tabs)
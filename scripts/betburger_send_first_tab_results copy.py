@@ -36,6 +36,12 @@ from src.utils.telegram_notifier import TelegramNotifier  # type: ignore
 
 logger = get_module_logger("betburger_send_first_tab_results")
 
+# Row-extraction patterns, compiled once at import
+_PERCENT_RE = re.compile(r"\b\d{1,2}(?:[\.,]\d{1,2})?\s*%\b")
+_MATCH_RE = re.compile(r"([A-Za-z0-9\.\-\'\s]+\svs\s[A-Za-z0-9\.\-\'\s]+)|([A-Za-z0-9\.\-\'\s]+\s-\s[A-Za-z0-9\.\-\'\s]+)")
+_BOOK_RE = re.compile(r"([A-Za-z][A-Za-z0-9_\-\.]{2,})\s*[:\-]?\s*(\d{1,3}[\.,]\d{1,2})")
+_TIME_RE = re.compile(r"\b\d{1,2}[:h]\d{2}\b|\b\d+\s*(min|minutes?)\b", re.I)
+
 
 def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
     """Best-effort extraction of top arbitrage/valuebet rows from Betburger listing.
@@ -45,11 +51,13 @@ def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
     """
     soup = BeautifulSoup(html, "lxml")
 
-    # Find candidate blocks that contain a percent label (e.g., 1.00%)
-    percent_re = re.compile(r"\b\d{1,2}(?:[\.,]\d{1,2})?\s*%\b")
-
-    candidates = []
-    for tag in soup.find_all(text=percent_re):
+    # Find candidate blocks that contain a percent label (e.g., 1.00%), unique by
+    # text (hashed: ints in the set instead of whole row strings). Only
+    # max_items * 2 are sampled, so stop climbing to rows once we have them.
+    seen = set()
+    uniq = []
+    limit = max_items * 2
+    for tag in soup.find_all(text=_PERCENT_RE):
         try:
             el = tag.parent
             # climb to a row-like container: the nearest div/li with multiple inline spans/links
@@ -62,30 +70,26 @@ def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
                 continue
             # collect visible text, collapse whitespace
             text = " ".join(row.get_text(" ", strip=True).split())
-            # Deduplicate by normalized text
-            candidates.append((row, text))
         except Exception:
             continue
-
-    # Unique by text
-    seen = set()
-    uniq = []
-    for row, text in candidates:
-        key = text.lower()
+        # Deduplicate by normalized text
+        key = hash(text.lower())
         if key in seen:
             continue
         seen.add(key)
         uniq.append((row, text))
+        if len(uniq) == limit:
+            break
 
     items = []
-    for row, text in uniq[: max_items * 2]:  # sample extra, then trim later
+    for row, text in uniq:  # sampled extra above, trimmed below
         try:
             # Extract fields heuristically
-            m_pct = percent_re.search(text)
+            m_pct = _PERCENT_RE.search(text)
             percent = m_pct.group(0) if m_pct else ""
 
             # Try to find a match name: often contains ' vs ' or hyphen with two teams
-            m_match = re.search(r"([A-Za-z0-9\.\-\'\s]+\svs\s[A-Za-z0-9\.\-\'\s]+)|([A-Za-z0-9\.\-\'\s]+\s-\s[A-Za-z0-9\.\-\'\s]+)", text)
+            m_match = _MATCH_RE.search(text)
             match_name = m_match.group(0) if m_match else ""
 
             # Attempt to capture sport from nearby headings
@@ -99,12 +103,12 @@ def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
 
             # Bookmakers and odds: look for sequences like "bookie: odd"
             books = []
-            for bk, odd in re.findall(r"([A-Za-z][A-Za-z0-9_\-\.]{2,})\s*[:\-]?\s*(\d{1,3}[\.,]\d{1,2})", text):
+            for bk, odd in _BOOK_RE.findall(text):
                 books.append(f"{bk}:{odd}")
             books_line = ", ".join(books[:3])
 
             # Meta: pick some time/league hints if present
-            m_time = re.search(r"\b\d{1,2}[:h]\d{2}\b|\b\d+\s*(min|minutes?)\b", text, flags=re.I)
+            m_time = _TIME_RE.search(text)
             meta = m_time.group(0) if m_time else ""
 
             items.append({
@@ -18,7 +18,7 @@ from __future__ import annotations
 import os
 import re
 import sys
-import time
+from itertools import islice
 from pathlib import Path
 from typing import List
 
@@ -33,9 +33,24 @@ from src.utils.logger import get_module_logger  # type: ignore
 from src.config.settings import ConfigManager  # type: ignore
 from src.browser.tab_manager import TabManager  # type: ignore
 from src.utils.telegram_notifier import TelegramNotifier  # type: ignore
+from src.parsers.betburger_html import extract_rows as _extract_rows_lxml  # type: ignore
+from src.browser.betburger_nav import HAS_ROWS_JS, PAGE_JS, READY_JS, wait_until  # type: ignore
+
+# The percent scan runs against many text nodes; use RE2's linear-time
+# matcher when google-re2 is installed
+try:
+    import re2 as _percent_engine  # type: ignore
+except ImportError:
+    _percent_engine = re
 
 logger = get_module_logger("betburger_send_first_tab_results")
 
+# Row-extraction patterns, compiled once at import
+_PERCENT_RE = _percent_engine.compile(r"\b\d{1,2}(?:[\.,]\d{1,2})?\s*%\b")
+_MATCH_RE = re.compile(r"([A-Za-z0-9\.\-\'\s]+\svs\s[A-Za-z0-9\.\-\'\s]+)|([A-Za-z0-9\.\-\'\s]+\s-\s[A-Za-z0-9\.\-\'\s]+)")
+_BOOK_RE = re.compile(r"([A-Za-z][A-Za-z0-9_\-\.]{2,})\s*[:\-]?\s*(\d{1,3}[\.,]\d{1,2})")
+_TIME_RE = re.compile(r"\b\d{1,2}[:h]\d{2}\b|\b\d+\s*(min|minutes?)\b", re.I)
+
 
 def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
     """Best-effort extraction of top arbitrage/valuebet rows from Betburger listing.
@@ -43,13 +58,23 @@ def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
     Returns a list of dicts with keys: sport, match, meta, percent, books.
     This is intentionally tolerant and may not capture every field.
     """
-    soup = BeautifulSoup(html, "lxml")
+    try:
+        return _extract_rows_lxml(html, max_items=max_items)
+    except Exception:
+        return _extract_rows_soup(html, max_items=max_items)
 
-    # Find candidate blocks that contain a percent label (e.g., 1.00%)
-    percent_re = re.compile(r"\b\d{1,2}(?:[\.,]\d{1,2})?\s*%\b")
 
-    candidates = []
-    for tag in soup.find_all(string=percent_re):
+def _extract_rows_soup(html: str, max_items: int = 5) -> List[dict]:
+    """BeautifulSoup version of _extract_rows, kept as a fallback."""
+    soup = BeautifulSoup(html, "lxml")
+
+    # Find candidate blocks that contain a percent label (e.g., 1.00%), unique by
+    # text (hashed: ints in the set instead of whole row strings). Only
+    # max_items * 2 are sampled, so stop climbing to rows once we have them.
+    seen = set()
+    uniq = []
+    limit = max_items * 2
+    for tag in soup.find_all(string=_PERCENT_RE):
         try:
             el = tag.parent
             # climb to a row-like container: the nearest div/li with multiple inline spans/links
@@ -62,29 +87,25 @@ def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
                 continue
             # collect visible text, collapse whitespace
             text = " ".join(row.get_text(" ", strip=True).split())
-            candidates.append((row, text))
         except Exception:
             continue
-
-    # Unique by text
-    seen = set()
-    uniq = []
-    for row, text in candidates:
-        key = text.lower()
+        key = hash(text.lower())
         if key in seen:
             continue
         seen.add(key)
         uniq.append((row, text))
+        if len(uniq) == limit:
+            break
 
     items = []
-    for row, text in uniq[: max_items * 2]:  # sample extra, then trim later
+    for row, text in uniq:  # sampled extra above, trimmed below
         try:
             # Extract fields heuristically
-            m_pct = percent_re.search(text)
+            m_pct = _PERCENT_RE.search(text)
             percent = m_pct.group(0) if m_pct else ""
 
             # Match name: contains ' vs ' or ' - '
-            m_match = re.search(r"([A-Za-z0-9\.\-\'\s]+\svs\s[A-Za-z0-9\.\-\'\s]+)|([A-Za-z0-9\.\-\'\s]+\s-\s[A-Za-z0-9\.\-\'\s]+)", text)
+            m_match = _MATCH_RE.search(text)
             match_name = m_match.group(0) if m_match else ""
 
             # Sport header near the row
@@ -97,13 +118,13 @@ def _extract_rows(html: str, max_items: int = 5) -> List[dict]:
                 pass
 
             # Bookmakers and odds
-            books = []
-            for bk, odd in re.findall(r"([A-Za-z][A-Za-z0-9_\-\.]{2,})\s*[:\-]?\s*(\d{1,3}[\.,]\d{1,2})", text):
-                books.append(f"{bk}:{odd}")
-            books_line = ", ".join(books[:3])
+            # Only three pairs are shown: stop scanning the row after them
+            books_line = ", ".join(
+                f"{m.group(1)}:{m.group(2)}" for m in islice(_BOOK_RE.finditer(text), 3)
+            )
 
             # Meta time/league hints
-            m_time = re.search(r"\b\d{1,2}[:h]\d{2}\b|\b\d+\s*(min|minutes?)\b", text, flags=re.I)
+            m_time = _TIME_RE.search(text)
             meta = m_time.group(0) if m_time else ""
 
             items.append({
@@ -145,14 +166,19 @@ def main() -> int:
             logger.error("No browser tabs available")
             return 2
         tm.driver.switch_to.window(handles[0])
-        time.sleep(0.5)
+        wait_until(tm.driver, READY_JS, 3)
         if "/es/arbs" not in (tm.driver.current_url or ""):
             tm.driver.get("https://www.betburger.com/es/arbs")
-            time.sleep(1.0)
+            wait_until(tm.driver, READY_JS, 10)
 
-        # Allow content to render
-        time.sleep(1.0)
-        html = tm.driver.page_source or ""
+        # Allow content to render: wait for visible percent figures (rows), not a fixed delay
+        wait_until(tm.driver, HAS_ROWS_JS, 3)
+        # Pruned page (no scripts/styles/chrome) instead of the whole page_source
+        # over the WebDriver wire
+        try:
+            html = tm.driver.execute_script(PAGE_JS) or ""
+        except Exception:
+            html = tm.driver.page_source or ""
         items = _extract_rows(html, max_items=5)
         text = _format_summary(items)
 
@@ -289,8 +289,15 @@ def write_parsed_json(alert: ParsedAlert, out_dir: Path) -> Path:
 # Orchestration
 # -----------------------------
 
-def process_file(file_path: Path, *, source: Optional[str], profile: Optional[str]) -> Optional[Path]:
-    if not file_path.exists():
+def process_file(
+    file_path: Path,
+    *,
+    source: Optional[str],
+    profile: Optional[str],
+    html: Optional[str] = None,
+) -> Optional[Path]:
+    # Callers that just wrote the snapshot pass its HTML to skip reading it back
+    if html is None and not file_path.exists():
         print(f"[process_snapshots] File not found: {file_path}", file=sys.stderr)
         return None
 
@@ -302,7 +309,7 @@ def process_file(file_path: Path, *, source: Optional[str], profile: Optional[st
 
     prof = profile or _infer_profile(file_path)
 
-    raw_html = load_html(file_path)
+    raw_html = load_html(file_path) if html is None else html
     cleaned = clean_html(raw_html)
     alert = parse_latest_alert(cleaned, source=src, profile=prof)
     if not alert:
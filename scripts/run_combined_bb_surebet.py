@@ -22,6 +22,7 @@ import time
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime, timezone
+from urllib.parse import urljoin
 import sys
 
 # Ensure package imports
@@ -35,8 +36,9 @@ from src.browser.tab_manager import TabManager  # type: ignore
 from src.browser.auth_manager import AuthManager  # type: ignore
 from src.browser.surebet_nav import select_saved_filter, get_selected_filter_name  # type: ignore
 from src.processors.surebet_parser import parse_surebet_valuebets_html  # type: ignore
-from src.utils.telegram_notifier import TelegramNotifier  # type: ignore
-from src.utils.snapshots import write_snapshot, read_snapshot, compute_hash  # type: ignore
+from src.utils.telegram_notifier import TelegramNotifier, send_outbox  # type: ignore
+from src.browser.betburger_nav import READY_JS, wait_until  # type: ignore
+from src.utils.snapshots import write_snapshot, compute_hash  # type: ignore
 from src.utils.command_controller import PauseController, BotCommandListener  # type: ignore
 from src.formatters.message_templates import EventCard, Selection, format_surebet_card  # type: ignore
 from src.snapshots.snapshot_manager import save_snapshot  # type: ignore
@@ -44,9 +46,7 @@ from scripts.smoke_betburger_arbs_tabs import (  # type: ignore
     login_with_remember_me,
     duplicate_tabs_to as bb_duplicate_tabs_to,
 )
-from scripts.betburger_send_all_tabs_results import (  # type: ignore
-    send_all_tabs_with_driver,
-)
+from scripts.betburger_send_all_tabs_results import send_all_tabs_with_driver  # type: ignore
 from scripts.process_snapshots import process_file as process_snapshot_file  # type: ignore
 
 logger = get_module_logger("run_combined_bb_surebet")
@@ -62,8 +62,8 @@ def _get_env_int(name: str, default: int) -> int:
 def _abs_url(base: str, link: Optional[str]) -> Optional[str]:
     if not link:
         return None
-    if link.startswith("http://") or link.startswith("https://"):
-        return link
+    # Absolute links pass through; root- and path-relative ones resolve against base
+    return urljoin(base.rstrip("/") + "/", link)
 
 
 def _safe_parse_dt(val: Optional[str]) -> Optional[datetime]:
@@ -90,9 +90,6 @@ def _safe_float(val) -> Optional[float]:
         return float(val)
     except Exception:
         return None
-    if link.startswith("/"):
-        return base.rstrip("/") + link
-    return link
 
 
 def _format_tab_summary(profile: str, tab_no: int, items: list[dict], base_url: str, top_k: int = 10) -> str:
@@ -165,9 +162,11 @@ def main() -> int:
 
         # Try to go directly to target page. If redirected to sign_in, then login.
         target_url_bb = "https://www.betburger.com/es/arbs"
-        logger.info("Navigating to Betburger page", url=target_url_bb)
-        tm.driver.get(target_url_bb)
-        time.sleep(1.0)
+        # A reused session may already be there: a get() would reload the whole app
+        if "betburger.com/es/arbs" not in (tm.driver.current_url or ""):
+            logger.info("Navigating to Betburger page", url=target_url_bb)
+            tm.driver.get(target_url_bb)
+            wait_until(tm.driver, READY_JS, 10)
 
         cur = tm.driver.current_url or ""
         if "/users/sign_in" in cur:
@@ -183,8 +182,9 @@ def main() -> int:
                 timeout=max(30, cfg.bot.browser_timeout),
             )
             # Ensure we land on arbs after login
-            tm.driver.get(target_url_bb)
-            time.sleep(1.0)
+            if "/es/arbs" not in (tm.driver.current_url or ""):
+                tm.driver.get(target_url_bb)
+                wait_until(tm.driver, READY_JS, 10)
         else:
             logger.info("Already authenticated on Betburger; skipping login")
 
@@ -304,6 +304,8 @@ def main() -> int:
                 logger.warning("Betburger iteration failed", error=str(e))
 
             # --- Surebet iteration ---
+            # Messages are queued per tab and sent as one batch once every tab has been read
+            surebet_outbox: list[tuple] = []
             for tab_no in range(1, target_tabs + 1):
                 # Switch to the corresponding Surebet tab handle first
                 tm.driver.switch_to.window(surebet_handles[tab_no - 1])
@@ -342,17 +344,18 @@ def main() -> int:
 
                 if snapshot_enabled:
                     try:
-                        path = write_snapshot(html, snapshot_dir, "surebet", profile_key)
-                        disk_html = read_snapshot(snapshot_dir, "surebet", profile_key) or html
-                        snap_hash = compute_hash(disk_html)
+                        # Hash the in-memory page first: unchanged pages are neither written nor read back
+                        html_bytes = html.encode("utf-8", "ignore")
+                        snap_hash = compute_hash(html_bytes)
                         if last_hash_by_profile.get(profile_key) == snap_hash:
                             logger.info("No changes since last snapshot; skipping send", tab=tab_no, profile=profile_key)
                             continue
+                        path = write_snapshot(html_bytes, snapshot_dir, "surebet", profile_key)
                         last_hash_by_profile[profile_key] = snap_hash
 
                         # Process snapshot to JSON latest
                         try:
-                            process_snapshot_file(Path(path), source="surebet", profile=profile_key)
+                            process_snapshot_file(Path(path), source="surebet", profile=profile_key, html=html)
                         except Exception as pe:
                             logger.warning("Failed processing Surebet snapshot to JSON; will fallback to HTML parsing", error=str(pe))
 
@@ -366,8 +369,7 @@ def main() -> int:
                                 if send_json:
                                     pretty = json.dumps(data, ensure_ascii=False, indent=2)
                                     msg = f"[surebet] Última alerta (perfil: {profile_key}, tab {tab_no})\n```json\n{pretty}\n```"
-                                    notifier.send_text(msg, chat_id=chat_id)
-                                    logger.info("Surebet JSON message sent", tab=tab_no, profile=profile_key)
+                                    surebet_outbox.append((chat_id, msg, "Surebet JSON message sent", {"tab": tab_no, "profile": profile_key}))
                                     continue  # done with this tab
                                 # Build formatted card (Europe/Madrid, comma pct)
                                 sel_a = data.get("selection_a") or {}
@@ -401,13 +403,12 @@ def main() -> int:
                                     reference_time=_safe_parse_dt(data.get("timestamp_utc")),
                                 )
                                 msg = format_surebet_card(card)
-                                notifier.send_text(msg, chat_id=chat_id)
-                                logger.info("Surebet JSON-based message sent", tab=tab_no, profile=profile_key)
+                                surebet_outbox.append((chat_id, msg, "Surebet JSON-based message sent", {"tab": tab_no, "profile": profile_key}))
                                 continue  # done with this tab
                             except Exception as je:
                                 logger.warning("Failed to read/format Surebet latest JSON; fallback to HTML parsing", error=str(je))
 
-                        html_to_parse = disk_html
+                        html_to_parse = html
                     except Exception as e:
                         logger.warning("Snapshot write/read failed; parsing from memory", error=str(e))
                         html_to_parse = html
@@ -417,10 +418,13 @@ def main() -> int:
             # Fallback path using existing parser and summary
                 alerts = parse_surebet_valuebets_html(html_to_parse, profile=profile_key)
                 if not alerts:
-                    if chat_id:
-                        notifier.send_text(f"[surebet] Sin eventos visibles (tab {tab_no}, perfil {profile_key}).", chat_id=chat_id)
-                    else:
-                        notifier.send_text(f"[surebet] Sin eventos visibles (tab {tab_no}, perfil {profile_key}).")
+                    # No chat_id: the notifier falls back to the support channel
+                    surebet_outbox.append((
+                        chat_id,
+                        f"[surebet] Sin eventos visibles (tab {tab_no}, perfil {profile_key}).",
+                        "Surebet empty-tab notice sent",
+                        {"tab": tab_no, "profile": profile_key},
+                    ))
                     continue
 
                 summary = _format_tab_summary(
@@ -430,7 +434,7 @@ def main() -> int:
                     cfg.surebet.base_url,
                     top_k=int(os.getenv("SUREBET_SUMMARY_TOP", "10")),
                 )
-                notifier.send_text(summary, chat_id=chat_id)
+                surebet_outbox.append((chat_id, summary, "Surebet summary sent", {"tab": tab_no, "profile": profile_key}))
                 logger.info("Surebet tab completed", tab=tab_no, profile=profile_key, total=len(alerts))
 
                 # --- Save HTML snapshot in new snapshot_manager format to enable /label ---
@@ -450,6 +454,8 @@ def main() -> int:
                 except Exception as se:
                     logger.warning("Failed to save snapshot for learning", error=str(se), tab=tab_no)
 
+            send_outbox(notifier, surebet_outbox)
+
             logger.info("Combined iteration completed", iteration=iteration)
             if not run_forever:
                 logger.info("Single pass mode finished")
@@ -27,6 +27,7 @@ import sys
 import time
 from pathlib import Path
 from typing import List, Optional
+from urllib.parse import urljoin
 
 # Ensure package imports
 ROOT = Path(__file__).resolve().parents[1]
@@ -40,7 +41,7 @@ from src.browser.auth_manager import AuthManager  # type: ignore
 from src.browser.surebet_nav import select_saved_filter  # type: ignore
 from src.processors.surebet_parser import parse_surebet_valuebets_html  # type: ignore
 from src.utils.telegram_notifier import TelegramNotifier  # type: ignore
-from src.utils.snapshots import write_snapshot, read_snapshot, compute_hash  # type: ignore
+from src.utils.snapshots import write_snapshot, compute_hash  # type: ignore
 
 logger = get_module_logger("run_surebet_select_and_send_all")
 
@@ -68,21 +69,11 @@ def _duplicate_tabs_to(driver, target_count: int) -> None:
     logger.info("Tabs ready", count=len(driver.window_handles))
 
 
-def _send_info(notifier: TelegramNotifier, text: str, chat_id: Optional[str]) -> None:
-    if chat_id:
-        notifier.send_text(text, chat_id=chat_id)
-    else:
-        notifier.send_text(text)
-
-
 def _abs_url(base: str, link: Optional[str]) -> Optional[str]:
     if not link:
         return None
-    if link.startswith("http://") or link.startswith("https://"):
-        return link
-    if link.startswith("/"):
-        return base.rstrip("/") + link
-    return link
+    # Absolute links pass through; root- and path-relative ones resolve against base
+    return urljoin(base.rstrip("/") + "/", link)
 
 
 def _format_tab_summary(profile: str, tab_no: int, items: list[dict], base_url: str, top_k: int = 10) -> str:
@@ -161,6 +152,8 @@ def main() -> int:
         last_hash_by_profile: dict[str, str] = {}
 
         def process_once() -> None:
+            # (chat_id, text, tab, profile, alert count) per tab, sent as one batch at the end
+            outbox: list[tuple] = []
             for tab_no in range(1, target_tabs + 1):
                 profile_key = os.environ.get(f"SUREBET_TAB_{tab_no}_PROFILE_KEY")
                 if not profile_key:
@@ -182,18 +175,19 @@ def main() -> int:
                 # Capture current page source
                 html = tm.driver.page_source or ""
 
-                # Optionally persist snapshot and read back from disk for parsing stability
+                # Optionally persist snapshot; the file holds exactly `html`, so parse from memory
                 if snapshot_enabled:
                     try:
-                        path = write_snapshot(html, snapshot_dir, "surebet", profile_key)
-                        disk_html = read_snapshot(snapshot_dir, "surebet", profile_key) or html
-                        snap_hash = compute_hash(disk_html)
-                        # Dedup: if hash unchanged for this profile, skip sending
+                        # Dedup on the in-memory page: if hash unchanged for this profile, skip
+                        # sending without touching disk
+                        html_bytes = html.encode("utf-8", "ignore")
+                        snap_hash = compute_hash(html_bytes)
                         if last_hash_by_profile.get(profile_key) == snap_hash:
                             logger.info("No changes since last snapshot; skipping send", tab=tab_no, profile=profile_key)
                             continue
+                        write_snapshot(html_bytes, snapshot_dir, "surebet", profile_key)
                         last_hash_by_profile[profile_key] = snap_hash
-                        html_to_parse = disk_html
+                        html_to_parse = html
                     except Exception as e:
                         logger.warning("Snapshot write/read failed; parsing from memory", error=str(e))
                         html_to_parse = html
@@ -204,7 +198,7 @@ def main() -> int:
                 alerts = parse_surebet_valuebets_html(html_to_parse, profile=profile_key)
 
                 if not alerts:
-                    _send_info(notifier, f"[surebet] Sin eventos visibles (tab {tab_no}, perfil {profile_key}).", chat_id)
+                    outbox.append((chat_id, f"[surebet] Sin eventos visibles (tab {tab_no}, perfil {profile_key}).", tab_no, profile_key, 0))
                     continue
 
                 # Send a single concise summary per tab to avoid spam/flood
@@ -215,8 +209,12 @@ def main() -> int:
                     cfg.surebet.base_url,
                     top_k=int(os.getenv("SUREBET_SUMMARY_TOP", "10")),
                 )
-                ok = notifier.send_text(summary, chat_id=chat_id)
-                logger.info("Tab completed", tab=tab_no, profile=profile_key, sent=int(bool(ok)), total=len(alerts))
+                outbox.append((chat_id, summary, tab_no, profile_key, len(alerts)))
+
+            # Chats are served concurrently; a missing chat_id goes to the support channel
+            results = notifier.send_batch([(chat_id, text) for chat_id, text, *_ in outbox])
+            for (_chat, _text, tab_no, profile_key, total), ok in zip(outbox, results):
+                logger.info("Tab completed", tab=tab_no, profile=profile_key, sent=int(bool(ok)), total=total)
 
         if run_forever:
             logger.info("Entering persistent loop", interval_sec=interval_sec)
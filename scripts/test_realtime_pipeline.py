@@ -429,7 +429,8 @@ class RealtimePipelineTest:
                                 payload = json.loads(payload)
                             except Exception:
                                 continue
-                        self.process_intercepted_request(url, payload, profile="unknown")
+                        # process_and_send is synchronous: keep it off this loop
+                        await asyncio.to_thread(self.process_intercepted_request, url, payload, profile="unknown")
                     except Exception as e:
                         logger.warning("capture_consume_error", error=str(e))
         except asyncio.CancelledError:
@@ -23,6 +23,30 @@ from ..utils.logger import get_module_logger
 
 logger = get_module_logger("betburger_nav")
 
+# Readiness signals polled instead of fixed sleeps
+READY_JS = "return document.readyState === 'complete';"
+HAS_ROWS_JS = "return !!document.body && /\\d\\s*%/.test(document.body.innerText);"
+# The page as page_source would return it, minus nodes nothing downstream reads
+# (scripts, styles, icons, cookie banner); serialized in the browser so a
+# third less HTML crosses the WebDriver wire, gets hashed and saved.
+# Rows are still extracted in Python (parsers.betburger_html.extract_rows)
+PAGE_JS = r"""
+var doc = document.documentElement.cloneNode(true);
+doc.querySelectorAll(
+    'script, style, noscript, template, link, svg, .cky-consent-container, .cky-modal, .cky-overlay'
+).forEach(function (e) { e.remove(); });
+return '<!DOCTYPE html>' + doc.outerHTML;
+"""
+
+
+def wait_until(driver, script: str, timeout: float) -> bool:
+    """Poll a JS predicate until it holds; False on timeout (callers carry on)."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(lambda d: d.execute_script(script))
+        return True
+    except Exception:
+        return False
+
 
 def _click_sidebar_link(driver, text_candidates: list[str], timeout: int = 15) -> bool:
     """Click a left-sidebar link by visible label.
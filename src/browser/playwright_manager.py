@@ -5,7 +5,9 @@ Uses sync API for simplicity. Designed to open a context with a rotating proxy
 """
 from __future__ import annotations
 
+import json
 import os
+import time
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -17,6 +19,11 @@ from proxy.pool import ProxyRotator
 
 logger = structlog.get_logger(__name__)
 
+# Cookies/localStorage dumped by scripts/betburger_headless_login.py after login
+STORAGE_STATE_FILE = "storage_state.json"
+# Older dumps are ignored (STORAGE_STATE_MAX_AGE_H): the login script is the only writer
+_STORAGE_STATE_MAX_AGE_H = 12.0
+
 
 class PlaywrightManager:
     def __init__(self, bot_cfg: BotConfig):
@@ -27,6 +34,8 @@ class PlaywrightManager:
         self.proxy_rotator = ProxyRotator()
         # Contextos creados por rotación per_tab para facilitar cleanup
         self._rotated_contexts: list[BrowserContext] = []
+        # new_context() kwargs restoring a saved login, if one was found
+        self._session_kwargs: dict = {}
 
     def launch(self, engine: str = "chromium", headless: Optional[bool] = None, user_data_dir: Optional[str] = None) -> Tuple[Browser, BrowserContext]:
         headless = self._resolve_headless(headless)
@@ -42,8 +51,17 @@ class PlaywrightManager:
             user_data_dir = str(Path.cwd() / "logs" / "playwright_profile")
         Path(user_data_dir).mkdir(parents=True, exist_ok=True)
 
-        logger.info("Launching Playwright", engine=engine, headless=headless, proxy=proxy_url, user_data_dir=user_data_dir)
-        if engine == "firefox":
+        # A fresh storage_state dump restores the session without reading the whole profile
+        # from disk; a stale one would start logged out, so use the profile instead
+        state_path = Path(user_data_dir) / STORAGE_STATE_FILE
+        self._session_kwargs = {"storage_state": str(state_path)} if self._storage_state_usable(state_path) else {}
+
+        logger.info("Launching Playwright", engine=engine, headless=headless, proxy=proxy_url, user_data_dir=user_data_dir, storage_state=bool(self._session_kwargs))
+        if engine == "firefox" and self._session_kwargs:
+            self.browser = self._pl.firefox.launch(headless=headless)
+            self.context = self.browser.new_context(proxy=proxy, **self._session_kwargs)
+            self._apply_performance_tweaks(self.context)
+        elif engine == "firefox":
             self.browser = self._pl.firefox.launch_persistent_context(user_data_dir=user_data_dir, headless=headless, proxy=proxy)  # type: ignore
             # When using launch_persistent_context, the return is actually a Context
             self.context = self.browser  # type: ignore[assignment]
@@ -51,7 +69,7 @@ class PlaywrightManager:
             self._apply_performance_tweaks(self.context)
         elif engine == "webkit":
             self.browser = self._pl.webkit.launch(headless=headless)
-            self.context = self.browser.new_context(proxy=proxy, user_agent=self._user_agent())
+            self.context = self.browser.new_context(proxy=proxy, user_agent=self._user_agent(), **self._session_kwargs)
             self._apply_performance_tweaks(self.context)
         else:  # chromium default
             # Hardened launch for server environments
@@ -66,11 +84,34 @@ class PlaywrightManager:
             if not self.browser:
                 logger.error("Chromium returned None on launch")
                 raise RuntimeError("Chromium failed to launch")
-            self.context = self.browser.new_context(proxy=proxy, user_agent=self._user_agent())
+            self.context = self.browser.new_context(proxy=proxy, user_agent=self._user_agent(), **self._session_kwargs)
             self._apply_performance_tweaks(self.context)
 
         return self.browser, self.context
 
+    @staticmethod
+    def _storage_state_usable(state_path: Path) -> bool:
+        """True if the dump exists, is recent enough and none of its cookies has expired."""
+        try:
+            age_h = (time.time() - state_path.stat().st_mtime) / 3600
+        except OSError:
+            return False
+        max_age_h = float(os.environ.get("STORAGE_STATE_MAX_AGE_H", _STORAGE_STATE_MAX_AGE_H))
+        if age_h > max_age_h:
+            logger.info("Ignoring stale storage state", path=str(state_path), age_h=round(age_h, 1))
+            return False
+        try:
+            cookies = json.loads(state_path.read_text(encoding="utf-8")).get("cookies") or []
+        except Exception as e:
+            logger.warning("Unreadable storage state; using profile", path=str(state_path), error=str(e))
+            return False
+        now = time.time()
+        # Session cookies carry expires=-1
+        if any(0 < (c.get("expires") or -1) < now for c in cookies):
+            logger.info("Storage state has expired cookies; using profile", path=str(state_path))
+            return False
+        return True
+
     def _resolve_headless(self, headless: Optional[bool]) -> bool:
         if headless is not None:
             return headless
@@ -126,7 +167,7 @@ class PlaywrightManager:
             proxy_url = self.proxy_rotator.next_proxy_url()
             proxy = {"server": proxy_url} if proxy_url else None
             try:
-                ctx = self.browser.new_context(proxy=proxy, user_agent=self._user_agent())
+                ctx = self.browser.new_context(proxy=proxy, user_agent=self._user_agent(), **self._session_kwargs)
                 # Fail fast on dead proxies
                 try:
                     ctx.set_default_navigation_timeout(8000)
@@ -155,7 +196,7 @@ class PlaywrightManager:
         assert self.browser is not None, "Browser not launched"
         proxy_url = self.proxy_rotator.next_proxy_url()
         proxy = {"server": proxy_url} if proxy_url else None
-        self.context = self.browser.new_context(proxy=proxy, user_agent=self._user_agent())
+        self.context = self.browser.new_context(proxy=proxy, user_agent=self._user_agent(), **self._session_kwargs)
         logger.info("Rotated proxy for new context", proxy=proxy_url)
         return self.context
 
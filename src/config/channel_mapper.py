@@ -11,6 +11,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import structlog
 
+# LibYAML C parser when available; falls back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = structlog.get_logger(__name__)
 
 
@@ -33,6 +39,7 @@ class ChannelMapper:
         
         self.config_path = Path(config_path)
         self.config = {}
+        self._profile_index: Dict[tuple, Dict[str, Any]] = {}
         self.load_config()
     
     def load_config(self) -> bool:
@@ -43,7 +50,8 @@ class ChannelMapper:
                 return False
             
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=_YamlLoader)
+            self._build_profile_index()
             
             logger.info("Configuration loaded successfully", 
                        betburger_profiles=len(self.config.get('betburger_profiles', {})),
@@ -55,18 +63,22 @@ class ChannelMapper:
             logger.error("Failed to load configuration", error=str(e), path=str(self.config_path))
             return False
     
+    def _build_profile_index(self) -> None:
+        """Flatten <source>_profiles into a (source, profile)-keyed dict."""
+        index = {}
+        for source in ("betburger", "surebet"):
+            for name, profile_config in (self.config.get(f'{source}_profiles') or {}).items():
+                if isinstance(profile_config, dict):
+                    index[(source, name)] = profile_config
+        self._profile_index = index
+    
     def get_channel_for_profile(self, source: str, profile: str) -> Optional[str]:
         """Get Telegram channel ID for a specific profile."""
-        if source == "betburger":
-            profiles = self.config.get('betburger_profiles', {})
-        elif source == "surebet":
-            profiles = self.config.get('surebet_profiles', {})
-        else:
-            logger.warning("Unknown source platform", source=source)
-            return None
-        
-        profile_config = profiles.get(profile)
+        profile_config = self._profile_index.get((source, profile))
         if not profile_config:
+            if source not in ("betburger", "surebet"):
+                logger.warning("Unknown source platform", source=source)
+                return None
             logger.warning("Profile not found in configuration", source=source, profile=profile)
             return None
         
@@ -2,22 +2,74 @@
 Configuration management for the arbitrage bot.
 Handles environment variables, channel mappings, and bot settings.
 """
+import copy
+import functools
 import os
 import yaml
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Prefer the LibYAML-backed loader when PyYAML was built against libyaml;
+# the pure-Python SafeLoader is several times slower on the same files.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+# Load environment variables from .env unless the orchestrator (systemd,
+# container runtime, ...) already injected them; skips the .env parse entirely.
+if not os.environ.get("TELEGRAM_BOT_TOKEN"):
+    load_dotenv(override=False)
+
+
+# Config search paths that depend only on this module's location.
+_SRC_DIR = os.path.dirname(__file__)
+_PROJECT_ROOT = os.path.abspath(os.path.join(_SRC_DIR, os.pardir))
+_PRIORITY = ("config-configurada.yml", "config.yml")
+_ROOT_CONFIG = os.path.join(_PROJECT_ROOT, "config.yml")
+
+# URL prefixes accepted by ConfigManager._sanitize_url
+_HTTP_SCHEMES = ("http://", "https://")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML config file once per (path, mtime_ns, size).
+
+    ``mtime_ns`` and ``size`` are only part of the cache key so that edits on
+    disk invalidate the entry, even within the same mtime tick.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data or {}
+
+
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Cached parse of a YAML config file, as a private copy.
+
+    The cached mapping is shared process-wide and its nested dicts are
+    mutable, so each caller gets its own deep copy.
+    """
+    return copy.deepcopy(_parse_yaml(path, mtime_ns, size))
+
+
+def _int_env(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer env var, returning ``default`` when it is unset."""
+    raw = env.get(key)
+    if raw is None:
+        return default
+    return int(raw)
+
+
+@dataclass(slots=True, frozen=True)
 class TelegramConfig:
     """Telegram bot configuration"""
     bot_token: str
     support_channel_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BetburgerConfig:
     """Betburger web scraping configuration"""
     username: Optional[str] = None
@@ -25,7 +77,7 @@ class BetburgerConfig:
     base_url: str = "https://betburger.com"
     login_url: str = "https://betburger.com/users/sign_in"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SurebetConfig:
     """Surebet web scraping configuration"""
     username: Optional[str] = None
@@ -34,7 +86,7 @@ class SurebetConfig:
     login_url: str = "https://es.surebet.com/users/sign_in"
     valuebets_url: str = "https://es.surebet.com/valuebets"
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """General bot configuration"""
     scraping_interval: int = 5
@@ -53,14 +105,20 @@ class BotConfig:
 
 class ConfigManager:
     """Manages all bot configuration"""
+
+    # Winning channel-mapping path per config_dir, shared by all instances
+    _resolved_paths: Dict[str, str] = {}
     
     def __init__(self, config_dir: str = "config"):
+        # Snapshot the environment once; the loaders below only read from it.
+        self._env = dict(os.environ)
         self.config_dir = config_dir
         self.telegram = self._load_telegram_config()
         self.betburger = self._load_betburger_config()
         self.surebet = self._load_surebet_config()
         self.bot = self._load_bot_config()
         self.channels = self._load_channel_mapping()
+        self._index_channels()
     
     @staticmethod
     def _sanitize_url(value: Optional[str], default: str) -> str:
@@ -70,36 +128,39 @@ class ConfigManager:
         being used as navigation targets by Selenium (which would turn them into
         file:/// URLs).
         """
-        if value and value.strip().lower().startswith(("http://", "https://")):
+        if value and value.strip().lower().startswith(_HTTP_SCHEMES):
             return value.strip()
         return default
 
     def _load_telegram_config(self) -> TelegramConfig:
         """Load Telegram configuration from environment"""
+        g = self._env.get
         return TelegramConfig(
-            bot_token=os.getenv("TELEGRAM_BOT_TOKEN", ""),
-            support_channel_id=os.getenv("TELEGRAM_SUPPORT_CHANNEL_ID", "")
+            bot_token=g("TELEGRAM_BOT_TOKEN", ""),
+            support_channel_id=g("TELEGRAM_SUPPORT_CHANNEL_ID", "")
         )
     
     def _load_betburger_config(self) -> BetburgerConfig:
         """Load Betburger web scraping configuration from environment"""
-        env_base = os.getenv("BETBURGER_BASE_URL")
-        env_login = os.getenv("BETBURGER_LOGIN_URL")
+        g = self._env.get
+        env_base = g("BETBURGER_BASE_URL")
+        env_login = g("BETBURGER_LOGIN_URL")
         return BetburgerConfig(
-            username=os.getenv("BETBURGER_USERNAME"),
-            password=os.getenv("BETBURGER_PASSWORD"),
+            username=g("BETBURGER_USERNAME"),
+            password=g("BETBURGER_PASSWORD"),
             base_url=self._sanitize_url(env_base, "https://betburger.com"),
             login_url=self._sanitize_url(env_login, "https://betburger.com/users/sign_in"),
         )
     
     def _load_surebet_config(self) -> SurebetConfig:
         """Load Surebet web scraping configuration from environment"""
-        env_base = os.getenv("SUREBET_BASE_URL")
-        env_login = os.getenv("SUREBET_LOGIN_URL")
-        env_valuebets = os.getenv("SUREBET_VALUEBETS_URL")
+        g = self._env.get
+        env_base = g("SUREBET_BASE_URL")
+        env_login = g("SUREBET_LOGIN_URL")
+        env_valuebets = g("SUREBET_VALUEBETS_URL")
         return SurebetConfig(
-            username=os.getenv("SUREBET_USERNAME"),
-            password=os.getenv("SUREBET_PASSWORD"),
+            username=g("SUREBET_USERNAME"),
+            password=g("SUREBET_PASSWORD"),
             base_url=self._sanitize_url(env_base, "https://es.surebet.com"),
             login_url=self._sanitize_url(env_login, "https://es.surebet.com/users/sign_in"),
             valuebets_url=self._sanitize_url(env_valuebets, "https://es.surebet.com/valuebets"),
@@ -107,22 +168,24 @@ class ConfigManager:
     
     def _load_bot_config(self) -> BotConfig:
         """Load general bot configuration from environment"""
+        env = self._env
+        g = env.get
         return BotConfig(
-            scraping_interval=int(os.getenv("SCRAPING_INTERVAL", "5")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            alert_timeout=int(os.getenv("ALERT_TIMEOUT", "2")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file=os.getenv("LOG_FILE", "logs/bot.log"),
-            headless_mode=os.getenv("HEADLESS_MODE", "false").lower() == "true",
-            browser_timeout=int(os.getenv("BROWSER_TIMEOUT", "30")),
-            proxy_type=os.getenv("BROWSER_PROXY_TYPE"),
-            proxy_host=os.getenv("BROWSER_PROXY_HOST"),
-            proxy_port=int(os.getenv("BROWSER_PROXY_PORT", "0")) or None,
-            proxy_username=os.getenv("BROWSER_PROXY_USERNAME"),
-            proxy_password=os.getenv("BROWSER_PROXY_PASSWORD"),
+            scraping_interval=_int_env(env, "SCRAPING_INTERVAL", 5),
+            max_retries=_int_env(env, "MAX_RETRIES", 3),
+            alert_timeout=_int_env(env, "ALERT_TIMEOUT", 2),
+            log_level=g("LOG_LEVEL", "INFO"),
+            log_file=g("LOG_FILE", "logs/bot.log"),
+            headless_mode=g("HEADLESS_MODE", "false").lower() == "true",
+            browser_timeout=_int_env(env, "BROWSER_TIMEOUT", 30),
+            proxy_type=g("BROWSER_PROXY_TYPE"),
+            proxy_host=g("BROWSER_PROXY_HOST"),
+            proxy_port=_int_env(env, "BROWSER_PROXY_PORT", 0) or None,
+            proxy_username=g("BROWSER_PROXY_USERNAME"),
+            proxy_password=g("BROWSER_PROXY_PASSWORD"),
         )
     
-    def _load_channel_mapping(self) -> Dict:
+    def _load_channel_mapping(self) -> Mapping:
         """Load channel mapping from YAML file.
 
         Search order:
@@ -131,34 +194,73 @@ class ConfigManager:
         3) repo_root/config.yml
         4) repo_root/config/channels.yaml (legacy)
         """
-        src_dir = os.path.dirname(__file__)
-        project_root = os.path.abspath(os.path.join(src_dir, os.pardir))
-        configured = os.path.join(src_dir, "config-configurada.yml")
-        preferred = os.path.join(src_dir, "config.yml")
-        root_config = os.path.join(project_root, "config.yml")
-        fallback = os.path.join(project_root, self.config_dir, "channels.yaml")
-
-        for path in (configured, preferred, root_config, fallback):
+        # Fast path: the file that won discovery last time, one stat() away
+        path = ConfigManager._resolved_paths.get(self.config_dir)
+        if path is not None:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    if data:
-                        return data
+                st = os.stat(path)
             except FileNotFoundError:
-                continue
+                st = None
+            if st is not None:
+                data = _parse_yaml_cached(path, st.st_mtime_ns, st.st_size)
+                if data:
+                    return data
+            ConfigManager._resolved_paths.pop(self.config_dir, None)
+
+        for path, st in self._iter_channel_files():
+            data = _parse_yaml_cached(path, st.st_mtime_ns, st.st_size)
+            if data:
+                ConfigManager._resolved_paths[self.config_dir] = path
+                return data
         return {}
+
+    def _iter_channel_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat) for existing channel-mapping files in search order."""
+        # One directory listing instead of a failed stat() per missing candidate
+        with os.scandir(_SRC_DIR) as it:
+            entries = {e.name: e for e in it if e.is_file()}
+        for name in _PRIORITY:
+            entry = entries.get(name)
+            if entry is not None:
+                yield entry.path, entry.stat()
+
+        # Only probe the project-level paths when src/config had nothing usable
+        fallback = os.path.join(_PROJECT_ROOT, self.config_dir, "channels.yaml")
+        for path in map(Path, (_ROOT_CONFIG, fallback)):
+            if path.is_file():
+                yield str(path), path.stat()
+
+    def _index_channels(self) -> None:
+        """Flatten per-profile lookups into (platform, profile)-keyed dicts.
+
+        Getters below are called per tab/alert; a single hashed lookup avoids
+        walking the nested YAML mapping on every call.
+        """
+        self._flat_channels: Dict[tuple, str] = {}
+        self._flat_defaults: Dict[tuple, Dict] = {}
+        self._flat_ui_filter: Dict[tuple, str] = {}
+        for platform in ("betburger", "surebet"):
+            for profile, data in (self.channels.get(f"{platform}_profiles") or {}).items():
+                if not isinstance(data, dict):
+                    continue
+                key = (platform, profile)
+                if data.get("channel_id"):
+                    self._flat_channels[key] = data["channel_id"]
+                if data.get("defaults"):
+                    self._flat_defaults[key] = data["defaults"]
+                ui_filter = data.get("ui_filter_name")
+                if isinstance(ui_filter, str) and ui_filter.strip():
+                    self._flat_ui_filter[key] = ui_filter.strip()
+        support = (self.channels.get("support") or {}).get("technical_alerts") or {}
+        self._support_channel: Optional[str] = support.get("channel_id")
     
     def get_channel_for_profile(self, platform: str, profile: str) -> Optional[str]:
         """Get Telegram channel ID for a specific profile"""
-        if platform == "betburger":
-            return self.channels.get("betburger_profiles", {}).get(profile, {}).get("channel_id")
-        elif platform == "surebet":
-            return self.channels.get("surebet_profiles", {}).get(profile, {}).get("channel_id")
-        return None
+        return self._flat_channels.get((platform, profile))
     
     def get_support_channel(self) -> Optional[str]:
         """Get technical support channel ID"""
-        return self.channels.get("support", {}).get("technical_alerts", {}).get("channel_id")
+        return self._support_channel
 
     def get_profile_defaults(self, platform: str, profile: str) -> Dict:
         """Return defaults dict for a given platform/profile without touching IDs.
@@ -171,8 +273,7 @@ class ConfigManager:
               selection_b: { bookmaker: "..." }
               market_label: "..."
         """
-        key = f"{platform}_profiles"
-        return self.channels.get(key, {}).get(profile, {}).get("defaults", {}) or {}
+        return self._flat_defaults.get((platform, profile)) or {}
 
     def get_profile_ui_filter_name(self, platform: str, profile: str) -> Optional[str]:
         """Return UI filter name (saved filter label) for a given platform/profile.
@@ -182,9 +283,4 @@ class ConfigManager:
           <profile>:
             ui_filter_name: "<text as appears in Betburger saved filters>"
         """
-        key = f"{platform}_profiles"
-        value = self.channels.get(key, {}).get(profile, {}).get("ui_filter_name")
-        if isinstance(value, str):
-            v = value.strip()
-            return v or None
-        return None
+        return self._flat_ui_filter.get((platform, profile))
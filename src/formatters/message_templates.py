@@ -54,6 +54,29 @@ class EventCard:
     reference_time: Optional[datetime]  # timestamp of detection for age
 
 
+def _sel_line(sel: Selection) -> str:
+    """Render one selection gracefully when fields are missing."""
+    bk = (sel.bookmaker or "").strip()
+    lbl = (sel.label or "").strip()
+    odd = str(sel.odd) if sel.odd is not None else "?"
+    if bk and lbl:
+        return f"{bk}: {lbl} @{odd}"
+    if bk and not lbl:
+        return f"{bk}: @{odd}"
+    if not bk and lbl:
+        return f"{lbl} @{odd}"
+    return f"@{odd}"
+
+
+def _clean(s: str) -> str:
+    s = (s or "").strip()
+    return "" if s in {"?", "-"} else s
+
+
+# Selections, blank line, match info (one line per present field), blank line, footer
+_format_card = "{}\n{}\n\n{}\n{}".format
+
+
 def format_surebet_card(card: EventCard) -> str:
     """Format a two-selection surebet/valuebet card in Telegram-friendly text.
 
@@ -63,51 +86,23 @@ def format_surebet_card(card: EventCard) -> str:
     - Date in Europe/Madrid timezone: dd/MM HH:mm
     - Footer: "SUREBET <prefix>: <pct>    <age>"
     """
-    lines: list[str] = []
-
-    # Selections — render gracefully if fields are missing
-    def _sel_line(sel: Selection) -> str:
-        bk = (sel.bookmaker or "").strip()
-        lbl = (sel.label or "").strip()
-        odd = str(sel.odd) if sel.odd is not None else "?"
-        if bk and lbl:
-            return f"{bk}: {lbl} @{odd}"
-        if bk and not lbl:
-            return f"{bk}: @{odd}"
-        if not bk and lbl:
-            return f"{lbl} @{odd}"
-        return f"@{odd}"
-
-    lines.append(_sel_line(card.selection_a))
-    lines.append(_sel_line(card.selection_b))
-    lines.append("")
-
     # Match info
     # Normalize sport capitalization (first letter upper)
-    def _clean(s: str) -> str:
-        s = (s or "").strip()
-        return "" if s in {"?", "-"} else s
-
     sport = _clean((card.sport or "").capitalize())
     league = _clean(card.league or "")
     # Only include start time when we actually have one
     start_str = _fmt_datetime_esmadrid(card.start_time) if card.start_time else ""
     match_line = _clean((card.match or "").replace(" vs ", " – "))
-
-    if sport:
-        lines.append(sport)
-    if league:
-        lines.append(league)
-    if start_str:
-        lines.append(start_str)
-    if match_line:
-        lines.append(match_line)
-    lines.append("")
+    info = "".join(f"{line}\n" for line in (sport, league, start_str, match_line) if line)
 
     # Footer
     pct = _fmt_percent(card.value_pct)
     now = datetime.now(tz=timezone.utc)
     age = _fmt_age_minutes(now, card.reference_time)
-    lines.append(f"SUREBET {card.source_prefix}: {pct}    {age}")
 
-    return "\n".join(lines)
+    return _format_card(
+        _sel_line(card.selection_a),
+        _sel_line(card.selection_b),
+        info,
+        f"SUREBET {card.source_prefix}: {pct}    {age}",
+    )
@@ -8,19 +8,83 @@ from __future__ import annotations
 
 import os
 import asyncio
+import functools
+import importlib.util
+import threading
+import time
 from typing import Optional, Dict, Any
 from datetime import datetime
 import structlog
 
+from processors.arbitrage_data import ArbitrageData
+
 try:
     import telegram
     from telegram import Bot
     from telegram.constants import ParseMode
+    from telegram.request import HTTPXRequest
 except ImportError:
     telegram = None
 
 logger = structlog.get_logger(__name__)
 
+# Alert header: "<urgency> <source emoji> **<SOURCE> ALERT**"
+_format_header = "{} {} **{} ALERT**".format
+_format_link = "   • [{}]({})".format
+
+
+# Telegram limits: ~1 message/s per chat, ~30 messages/s overall
+_PER_CHAT_INTERVAL = 1.0
+_GLOBAL_CONCURRENCY = 30
+
+_URGENCY_EMOJIS = {
+    "critical": "🚨",
+    "high": "⚡",
+    "medium": "⏰",
+    "low": "📅",
+    "unknown": "❓",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _source_label(source: str) -> str:
+    """Upper-cased source name; sources come from a small fixed set."""
+    return source.upper()
+
+
+_sync_state = threading.local()
+
+
+def run_sync(coro):
+    """Run a coroutine from synchronous code.
+
+    Reuses one private event loop per thread so pooled HTTP connections
+    survive between calls. Code already running inside an event loop must
+    await the coroutine itself; calling this from there raises RuntimeError.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        name = getattr(coro, "__qualname__", "the coroutine")
+        coro.close()
+        raise RuntimeError(f"Synchronous wrapper called inside a running event loop; await {name}() instead")
+
+    loop = getattr(_sync_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _sync_state.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+def close_sync_loop() -> None:
+    """Close this thread's private run_sync loop, if it has one."""
+    loop = getattr(_sync_state, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+    _sync_state.loop = None
+
 
 class TelegramSender:
     """Sends arbitrage alerts to Telegram channels."""
@@ -29,6 +93,16 @@ class TelegramSender:
         """Initialize Telegram sender."""
         self.bot_token = bot_token or os.environ.get("TELEGRAM_BOT_TOKEN")
         self.bot = None
+        self._request = None
+        # (epoch second, "%H:%M:%S") of the last footer; bursts share a second
+        self._ts_cache = (0, "")
+        # Send pacing: FIFO lock + earliest next send time per channel
+        self._channel_locks: Dict[str, asyncio.Lock] = {}
+        self._next_send: Dict[str, float] = {}
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._pacing_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Resolve the structlog proxy once; failure logging sits on the send path
+        self._log_error = logger.bind().error
         
         if not self.bot_token:
             logger.warning("No Telegram bot token provided")
@@ -39,121 +113,179 @@ class TelegramSender:
             return
         
         try:
-            self.bot = Bot(token=self.bot_token)
+            # Pooled keep-alive connections so concurrent sends share sockets
+            self._request = self._build_request()
+            self.bot = Bot(
+                token=self.bot_token,
+                request=self._request,
+                get_updates_request=self._request,
+            )
             logger.info("Telegram bot initialized successfully")
         except Exception as e:
             logger.error("Failed to initialize Telegram bot", error=str(e))
     
-    def format_arbitrage_message(self, arb_data) -> str:
+    @staticmethod
+    def _build_request():
+        """HTTP/2 request pool, or HTTP/1.1 when the h2 package is missing."""
+        options = dict(connection_pool_size=32, pool_timeout=1.0, read_timeout=15, connect_timeout=5)
+        # PTB raises RuntimeError (not ImportError) for http_version="2" without h2
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("h2 not installed, using HTTP/1.1. Install with: pip install 'python-telegram-bot[http2]'")
+            return HTTPXRequest(**options)
+        return HTTPXRequest(http_version="2", **options)
+    
+    async def close_async(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._request is not None:
+            await self._request.shutdown()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP client and this thread's private event loop."""
+        run_sync(self.close_async())
+        close_sync_loop()
+    
+    def format_arbitrage_message(self, arb_data: ArbitrageData) -> str:
         """Format arbitrage data into rich Telegram message."""
-        from processors.arbitrage_data import ArbitrageData
-        
-        if not isinstance(arb_data, ArbitrageData):
+        try:
+            source = arb_data.source
+        except AttributeError:
             return "❌ Invalid arbitrage data"
         
         # Urgency emoji
-        urgency_emojis = {
-            "critical": "🚨",
-            "high": "⚡",
-            "medium": "⏰", 
-            "low": "📅",
-            "unknown": "❓"
-        }
-        
-        urgency_emoji = urgency_emojis.get(arb_data.urgency_level, "❓")
+        urgency_emoji = _URGENCY_EMOJIS.get(arb_data.urgency_level, "❓")
         
         # Source emoji
-        source_emoji = "🎯" if arb_data.source == "betburger" else "💎"
+        source_emoji = "🎯" if source == "betburger" else "💎"
         
         # Build message
         lines = []
+        add = lines.append
         
         # Header with urgency
-        lines.append(f"{urgency_emoji} {source_emoji} **{arb_data.source.upper()} ALERT**")
-        lines.append("")
+        add(_format_header(urgency_emoji, source_emoji, _source_label(source)))
+        add("")
         
         # Event info
         if arb_data.sport:
-            lines.append(f"🏆 **Sport:** {arb_data.sport.title()}")
+            add(f"🏆 **Sport:** {arb_data.sport.title()}")
         
         if arb_data.league:
-            lines.append(f"🏟️ **League:** {arb_data.league}")
+            add(f"🏟️ **League:** {arb_data.league}")
         
         if arb_data.match:
-            lines.append(f"⚽ **Match:** {arb_data.match}")
+            add(f"⚽ **Match:** {arb_data.match}")
         
         if arb_data.market:
             market_text = arb_data.market_details or arb_data.market
-            lines.append(f"📊 **Market:** {market_text}")
+            add(f"📊 **Market:** {market_text}")
         
-        lines.append("")
+        add("")
         
         # Timing info (CRITICAL)
         if arb_data.event_start:
-            lines.append(f"📅 **Event Start:** {arb_data.event_start}")
+            add(f"📅 **Event Start:** {arb_data.event_start}")
         
         minutes = arb_data.minutes_to_start
         if minutes is not None:
             if minutes <= 5:
-                lines.append(f"⏰ **URGENT:** Starts in {minutes} minutes!")
+                add(f"⏰ **URGENT:** Starts in {minutes} minutes!")
             elif minutes <= 60:
-                lines.append(f"⏰ **Time to Start:** {minutes} minutes")
+                add(f"⏰ **Time to Start:** {minutes} minutes")
             else:
                 hours = minutes // 60
                 mins = minutes % 60
-                lines.append(f"⏰ **Time to Start:** {hours}h {mins}m")
+                add(f"⏰ **Time to Start:** {hours}h {mins}m")
         
-        lines.append("")
+        add("")
         
         # Bookmaker info
         if arb_data.selection_a:
-            lines.append(f"🏪 **{arb_data.selection_a.bookmaker.title()}:** {arb_data.selection_a.odd}")
+            add(f"🏪 **{arb_data.selection_a.bookmaker.title()}:** {arb_data.selection_a.odd}")
         
         if arb_data.selection_b:
-            lines.append(f"🏪 **{arb_data.selection_b.bookmaker.title()}:** {arb_data.selection_b.odd}")
+            add(f"🏪 **{arb_data.selection_b.bookmaker.title()}:** {arb_data.selection_b.odd}")
         
-        lines.append("")
+        add("")
         
         # Profit info
         profit = arb_data.profit_percentage
         if profit:
             profit_emoji = "💰" if profit >= 5 else "💵"
             profit_type = "ROI" if arb_data.roi_pct else "Value"
-            lines.append(f"{profit_emoji} **{profit_type}:** {profit:.2f}%")
+            add(f"{profit_emoji} **{profit_type}:** {profit:.2f}%")
         
         if arb_data.stake_recommendation:
-            lines.append(f"💸 **Recommended Stake:** ${arb_data.stake_recommendation:.0f}")
+            add(f"💸 **Recommended Stake:** ${arb_data.stake_recommendation:.0f}")
         
-        lines.append("")
+        add("")
         
         # Links (CRITICAL)
         if arb_data.bookmaker_links:
-            lines.append("🔗 **Direct Links:**")
-            for bookmaker, link in arb_data.bookmaker_links.items():
-                lines.append(f"   • [{bookmaker.title()}]({link})")
+            add("🔗 **Direct Links:**")
+            add("\n".join(_format_link(bookmaker.title(), link) for bookmaker, link in arb_data.bookmaker_links.items()))
         elif arb_data.target_link:
-            lines.append(f"🔗 [**Open Bet**]({arb_data.target_link})")
+            add(f"🔗 [**Open Bet**]({arb_data.target_link})")
         
-        lines.append("")
+        add("")
         
         # Footer
-        lines.append(f"🏷️ **Profile:** {arb_data.profile}")
+        add(f"🏷️ **Profile:** {arb_data.profile}")
         if arb_data.filter_id:
-            lines.append(f"🔍 **Filter ID:** {arb_data.filter_id}")
+            add(f"🔍 **Filter ID:** {arb_data.filter_id}")
         
-        lines.append(f"⏱️ **Detected:** {datetime.now().strftime('%H:%M:%S')}")
+        sec = int(time.time())
+        ts_sec, ts_str = self._ts_cache
+        if sec != ts_sec:
+            ts_str = datetime.fromtimestamp(sec).strftime('%H:%M:%S')
+            self._ts_cache = (sec, ts_str)
+        add(f"⏱️ **Detected:** {ts_str}")
         
         return "\n".join(lines)
     
-    async def send_alert_async(self, arb_data, channel_id: str) -> bool:
+    async def send_alert_async(self, arb_data: ArbitrageData, channel_id: str) -> bool:
         """Send alert to Telegram channel asynchronously."""
+        try:
+            message = self.format_arbitrage_message(arb_data)
+        except Exception as e:
+            self._log_error("Failed to format Telegram alert", channel=channel_id, error=str(e))
+            return False
+        return await self._send_raw_async(channel_id, message, arb_data)
+    
+    async def _send_raw_async(self, channel_id: str, message: str, arb_data: ArbitrageData = None) -> bool:
+        """Send an already formatted alert; ``arb_data`` only feeds the logs.
+        
+        Sends to the same channel go out in FIFO order at most once per
+        _PER_CHAT_INTERVAL; different channels overlap, up to
+        _GLOBAL_CONCURRENCY requests in flight.
+        """
         if not self.bot:
             logger.error("Telegram bot not initialized")
             return False
         
+        loop = asyncio.get_running_loop()
+        if loop is not self._pacing_loop:
+            # Locks and semaphores bind to a loop; start over on a new one
+            self._channel_locks.clear()
+            self._global_limit = asyncio.Semaphore(_GLOBAL_CONCURRENCY)
+            self._pacing_loop = loop
+        
+        lock = self._channel_locks.get(channel_id)
+        if lock is None:
+            lock = self._channel_locks[channel_id] = asyncio.Lock()
+        
+        async with lock:
+            delay = self._next_send.get(channel_id, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with self._global_limit:
+                sent = await self._deliver(channel_id, message, arb_data)
+            self._next_send[channel_id] = time.monotonic() + _PER_CHAT_INTERVAL
+        return sent
+    
+    async def _deliver(self, channel_id: str, message: str, arb_data: ArbitrageData = None) -> bool:
+        """Send one formatted alert."""
+        source = getattr(arb_data, "source", None)
         try:
-            message = self.format_arbitrage_message(arb_data)
-            
             await self.bot.send_message(
                 chat_id=channel_id,
                 text=message,
@@ -164,31 +296,25 @@ class TelegramSender:
             logger.info(
                 "Alert sent to Telegram",
                 channel=channel_id,
-                source=arb_data.source,
-                filter_id=arb_data.filter_id,
-                profit=arb_data.profit_percentage
+                source=source,
+                filter_id=getattr(arb_data, "filter_id", None),
+                profit=getattr(arb_data, "profit_percentage", None)
             )
             
             return True
             
         except Exception as e:
-            logger.error(
+            self._log_error(
                 "Failed to send Telegram alert",
                 channel=channel_id,
                 error=str(e),
-                source=arb_data.source
+                source=source
             )
             return False
     
-    def send_alert(self, arb_data, channel_id: str) -> bool:
+    def send_alert(self, arb_data: ArbitrageData, channel_id: str) -> bool:
         """Send alert to Telegram channel (synchronous wrapper)."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_alert_async(arb_data, channel_id))
+        return run_sync(self.send_alert_async(arb_data, channel_id))
     
     async def send_test_message_async(self, channel_id: str, message: str = None) -> bool:
         """Send test message to verify bot works."""
@@ -209,18 +335,12 @@ class TelegramSender:
             return True
             
         except Exception as e:
-            logger.error("Failed to send test message", channel=channel_id, error=str(e))
+            self._log_error("Failed to send test message", channel=channel_id, error=str(e))
             return False
     
     def send_test_message(self, channel_id: str, message: str = None) -> bool:
         """Send test message (synchronous wrapper)."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_test_message_async(channel_id, message))
+        return run_sync(self.send_test_message_async(channel_id, message))
 
 
 def create_sender(bot_token: str = None) -> TelegramSender:
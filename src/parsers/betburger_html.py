@@ -2,12 +2,16 @@
 
 Extracts basic page info and heuristically infers filter.
 This first version is conservative: it looks at <title>, headers, and URL (from meta).
+`extract_rows` scans the /es/arbs listing for the summary rows the senders post.
 """
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import List, Optional
+
+from lxml import etree, html as lxml_html  # type: ignore
 try:
     from bs4 import BeautifulSoup  # type: ignore
 except Exception:  # pragma: no cover
@@ -17,6 +21,37 @@ from ..utils.logger import get_module_logger
 
 logger = get_module_logger("betburger_html")
 
+# The percent scan runs against many text nodes; use RE2's linear-time
+# matcher when google-re2 is installed
+try:
+    import re2 as _percent_engine  # type: ignore
+except ImportError:
+    _percent_engine = re
+
+# Row-extraction patterns, compiled once at import
+_PERCENT_RE = _percent_engine.compile(r"\b\d{1,2}(?:[\.,]\d{1,2})?\s*%\b")
+# "<a> vs <b>" or "<a> - <b>"; only tried at the start of a name run, since a
+# run that fails there fails at every later offset too (avoids O(n^2) retries)
+_MATCH_RE = re.compile(r"(?<![A-Za-z0-9\.\-\'\s])[A-Za-z0-9\.\-\'\s]+\s(?:vs|-)\s[A-Za-z0-9\.\-\'\s]+")
+_BOOK_RE = re.compile(r"([A-Za-z][A-Za-z0-9_\-\.]{2,})\s*[:\-]?\s*(\d{1,3}[\.,]\d{1,2})")
+_TIME_RE = re.compile(r"\b\d{1,2}[:h]\d{2}\b|\b\d+\s*(min|minutes?)\b", re.I)
+
+# Row scan, evaluated by lxml in C: only text nodes containing "%" reach Python
+_PERCENT_NODES = etree.XPath("//text()[contains(., '%')]")
+_TEXT_NODES = etree.XPath(".//text()")
+_ROW_HAS_LINK = etree.XPath("boolean(.//a | .//span)")
+_ROW_TAGS = ("li", "tr", "div")
+_NON_TEXT_TAGS = ("script", "style")
+_SPORT_WORDS = ("Fútbol", "Football", "Tenis", "Tennis")
+# Headings that may name the sport: nearest preceding and nearest enclosing
+# candidate (reverse axes, so [1] is the closest), returned in document order
+_SPORT_HEAD_TEST = (
+    "[self::h1 or self::h2 or self::h3 or self::div or self::span]"
+    "[" + " or ".join(f"contains(., '{k}')" for k in _SPORT_WORDS) + "]"
+)
+_SPORT_HEADS = etree.XPath(f"preceding::*{_SPORT_HEAD_TEST}[1] | ancestor::*{_SPORT_HEAD_TEST}[1]")
+_SPORT_HEADS_ALL = etree.XPath(f"(preceding::* | ancestor::*){_SPORT_HEAD_TEST}")
+
 
 @dataclass
 class ParsedItem:
@@ -116,3 +151,114 @@ def parse(html: str, url: str = "") -> ParsedPage:
         items=items,
         signals=signals,
     )
+
+
+def _strings(el) -> list:
+    """Visible text nodes under ``el`` (script/style bodies skipped)."""
+    return [t for t in _TEXT_NODES(el) if not (t.is_text and t.getparent().tag in _NON_TEXT_TAGS)]
+
+
+def _text_container(node):
+    """Element that holds a text node (a tail belongs to its element's parent)."""
+    parent = node.getparent()
+    return parent.getparent() if node.is_tail else parent
+
+
+def _sport_head(candidates):
+    """First candidate whose visible text names a sport, or None."""
+    for head in candidates:
+        if any(k in "".join(_strings(head)) for k in _SPORT_WORDS):
+            return head
+    return None
+
+
+def extract_rows(html: str, max_items: int = 5) -> List[dict]:
+    """Extract top arbitrage/valuebet rows from Betburger listing.
+
+    Returns a list of dicts with keys: sport, match, meta, percent, books.
+    """
+    try:
+        doc = lxml_html.document_fromstring(html)
+    except ValueError:
+        # Empty document, or a str carrying an XML encoding declaration
+        try:
+            doc = lxml_html.document_fromstring(html.encode("utf-8"))
+        except Exception:
+            return []
+
+    # Percent nodes of one row climb to the same element: skip those
+    # before paying for the row text, then dedupe distinct rows by the hash
+    # of their lowercased text (an int per entry instead of the whole row).
+    # Elements (not id()) are kept so lxml proxies stay alive and unique.
+    seen_rows = set()
+    seen = set()
+    uniq = []
+    limit = max_items * 2
+    for node in _PERCENT_NODES(doc):
+        if not _PERCENT_RE.search(node):
+            continue
+        try:
+            row = _text_container(node)
+            for _ in range(4):
+                if row is not None and row.tag in _ROW_TAGS and _ROW_HAS_LINK(row):
+                    break
+                row = row.getparent()
+            if row is None or row in seen_rows:
+                continue
+            seen_rows.add(row)
+            text = " ".join(" ".join(_strings(row)).split())
+        except Exception:
+            continue
+        key = hash(text.lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        uniq.append((row, text))
+        if len(uniq) == limit:
+            break
+
+    items = []
+    for row, text in uniq:
+        try:
+            m_pct = _PERCENT_RE.search(text)
+            percent = m_pct.group(0) if m_pct else ""
+
+            # Match name: contains ' vs ' or ' - '. The row text is squashed
+            # to single spaces, so without either substring the scan can't hit
+            m_match = _MATCH_RE.search(text) if (" vs " in text or " - " in text) else None
+            match_name = m_match.group(0) if m_match else ""
+
+            # Sport header near the row
+            sport = ""
+            try:
+                # XPath narrows to headings containing a sport word; its text
+                # test also counts script bodies, so confirm and widen if needed
+                for heads in (_SPORT_HEADS, _SPORT_HEADS_ALL):
+                    head = _sport_head(reversed(heads(row)))
+                    if head is not None:
+                        sport = " ".join(t.strip() for t in _strings(head) if t.strip())
+                        break
+            except Exception:
+                pass
+
+            # Bookmakers and odds
+            # Only three pairs are shown: stop scanning the row after them
+            books_line = ", ".join(
+                f"{m.group(1)}:{m.group(2)}" for m in islice(_BOOK_RE.finditer(text), 3)
+            )
+
+            # Meta time/league hints
+            m_time = _TIME_RE.search(text)
+            meta = m_time.group(0) if m_time else ""
+
+            items.append({
+                "sport": sport,
+                "match": match_name,
+                "percent": percent,
+                "books": books_line,
+                "meta": meta,
+            })
+        except Exception:
+            continue
+
+    return items[:max_items]
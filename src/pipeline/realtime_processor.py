@@ -7,6 +7,7 @@ based on profile configuration and filters.
 from __future__ import annotations
 
 import os
+import time
 import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -16,7 +17,7 @@ from processors.betburger_parser import BetburgerParser
 from processors.surebet_parser import SurebetParser
 from processors.arbitrage_data import ArbitrageData
 from config.channel_mapper import ChannelMapper
-from notifications.telegram_sender import TelegramSender
+from notifications.telegram_sender import TelegramSender, run_sync
 
 logger = structlog.get_logger(__name__)
 
@@ -33,6 +34,12 @@ class RealtimeProcessor:
         self.betburger_processor = BetburgerParser()
         self.surebet_processor = SurebetParser()
         
+        # (URL marker, source, processor), checked in order
+        self._dispatch = (
+            ("betburger.com", "betburger", self.betburger_processor),
+            ("surebet.com", "surebet", self.surebet_processor),
+        )
+        
         # Stats
         self.processed_count = 0
         self.sent_count = 0
@@ -44,12 +51,9 @@ class RealtimeProcessor:
         """Process a single intercepted request and return arbitrage data."""
         try:
             # Determine source platform
-            if "betburger.com" in url:
-                source = "betburger"
-                processor = self.betburger_processor
-            elif "surebet.com" in url:
-                source = "surebet"
-                processor = self.surebet_processor
+            for marker, source, processor in self._dispatch:
+                if marker in url:
+                    break
             else:
                 logger.warning("Unknown platform in URL", url=url)
                 return []
@@ -75,8 +79,12 @@ class RealtimeProcessor:
             return []
     
     async def send_alerts_async(self, arbitrage_alerts: List[ArbitrageData]) -> int:
-        """Send multiple alerts to appropriate channels asynchronously."""
-        sent_count = 0
+        """Send multiple alerts to appropriate channels asynchronously.
+        
+        Channels are resolved for every alert first; all sends then go out
+        under a single gather so their round-trips overlap.
+        """
+        pairs = []
         
         for arb_data in arbitrage_alerts:
             try:
@@ -98,41 +106,51 @@ class RealtimeProcessor:
                     )
                     continue
                 
-                # Send to all matching channels
-                for channel_id in channels:
-                    success = await self.telegram_sender.send_alert_async(arb_data, channel_id)
-                    if success:
-                        sent_count += 1
-                        logger.info(
-                            "Alert sent successfully",
-                            channel=channel_id,
-                            source=arb_data.source,
-                            profile=arb_data.profile,
-                            profit=arb_data.profit_percentage
-                        )
-                    else:
-                        self.error_count += 1
+                # Format once, reuse the text for every target channel
+                message = self.telegram_sender.format_arbitrage_message(arb_data)
+                pairs.extend((arb_data, channel_id, message) for channel_id in channels)
                         
             except Exception as e:
                 logger.error("Failed to send alert", error=str(e), source=arb_data.source)
                 self.error_count += 1
         
+        # Send every (alert, channel) pair concurrently
+        results = await asyncio.gather(
+            *(
+                self.telegram_sender._send_raw_async(channel_id, message, arb_data)
+                for arb_data, channel_id, message in pairs
+            ),
+            return_exceptions=True,
+        )
+        
+        sent_count = 0
+        for (arb_data, channel_id, _), result in zip(pairs, results):
+            if result is True:
+                sent_count += 1
+                logger.info(
+                    "Alert sent successfully",
+                    channel=channel_id,
+                    source=arb_data.source,
+                    profile=arb_data.profile,
+                    profit=arb_data.profit_percentage
+                )
+            else:
+                self.error_count += 1
+        
         self.sent_count += sent_count
         return sent_count
     
     def send_alerts(self, arbitrage_alerts: List[ArbitrageData]) -> int:
-        """Send alerts synchronously (wrapper for async method)."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_alerts_async(arbitrage_alerts))
+        """Send alerts synchronously (wrapper for async method).
+
+        Raises RuntimeError inside a running event loop: await
+        send_alerts_async there instead.
+        """
+        return run_sync(self.send_alerts_async(arbitrage_alerts))
     
     def process_and_send(self, url: str, response_data: Dict[str, Any], profile: str = None) -> int:
         """Process request and immediately send alerts to Telegram."""
-        start_time = datetime.now()
+        t0 = time.perf_counter_ns()
         
         # Process the request
         arbitrage_alerts = self.process_request(url, response_data, profile)
@@ -144,7 +162,7 @@ class RealtimeProcessor:
         sent_count = self.send_alerts(arbitrage_alerts)
         
         # Calculate latency
-        latency = (datetime.now() - start_time).total_seconds()
+        latency = (time.perf_counter_ns() - t0) / 1e9
         
         logger.info(
             "Process and send completed",
@@ -184,18 +202,23 @@ class RealtimeProcessor:
             if channel_id:
                 all_channels.append((f"support.{support_name}", channel_id))
         
-        # Test each channel
-        for channel_name, channel_id in all_channels:
-            try:
-                success = await self.telegram_sender.send_test_message_async(
-                    channel_id, 
-                    f"🧪 **Test de conectividad**\n\nCanal: {channel_name}\nID: {channel_id}\n⏱️ {datetime.now().strftime('%H:%M:%S')}"
+        # Test all channels concurrently
+        sent_at = datetime.now().strftime('%H:%M:%S')
+        outcomes = await asyncio.gather(
+            *(
+                self.telegram_sender.send_test_message_async(
+                    channel_id,
+                    f"🧪 **Test de conectividad**\n\nCanal: {channel_name}\nID: {channel_id}\n⏱️ {sent_at}"
                 )
-                results[channel_name] = success
-                
-            except Exception as e:
-                logger.error("Channel test failed", channel=channel_name, error=str(e))
-                results[channel_name] = False
+                for channel_name, channel_id in all_channels
+            ),
+            return_exceptions=True,
+        )
+        
+        for (channel_name, _), outcome in zip(all_channels, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Channel test failed", channel=channel_name, error=str(outcome))
+            results[channel_name] = outcome is True
         
         return results
     
@@ -14,23 +14,24 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BookmakerSelection:
     """Represents a bookmaker selection with odds."""
     bookmaker: str
     odd: float
     
     def __post_init__(self):
-        # Ensure odd is float
+        # Ensure odd is float (frozen: normalize via object.__setattr__)
         if isinstance(self.odd, str):
             try:
-                self.odd = float(self.odd)
+                odd = float(self.odd)
             except ValueError:
                 logger.warning("Invalid odd value", odd=self.odd, bookmaker=self.bookmaker)
-                self.odd = 0.0
+                odd = 0.0
+            object.__setattr__(self, "odd", odd)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageData:
     """Unified arbitrage data structure for all platforms."""
     
@@ -12,7 +12,7 @@ from __future__ import annotations
 import os
 import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 
 def _ensure_dir(path: Path) -> None:
@@ -30,9 +30,22 @@ def atomic_write_text(dest: Path, content: str, encoding: str = "utf-8") -> None
     os.replace(tmp, dest)
 
 
-def compute_hash(content: str) -> str:
-    """Compute a stable SHA1 hash for change detection."""
-    return hashlib.sha1(content.encode("utf-8", errors="ignore")).hexdigest()
+def atomic_write_bytes(dest: Path, content: bytes) -> None:
+    """Bytes counterpart of atomic_write_text, for already-encoded pages."""
+    _ensure_dir(dest.parent)
+    tmp = dest.with_suffix(dest.suffix + ".tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, dest)
+
+
+def compute_hash(content: Union[str, bytes]) -> str:
+    """Compute a stable SHA1 hash for change detection.
+
+    Pass the UTF-8 bytes when the caller also writes them, so the page is encoded once.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8", errors="ignore")
+    return hashlib.sha1(content).hexdigest()
 
 
 def snapshot_path(base_dir: Path, platform: str, profile: str) -> Path:
@@ -41,10 +54,16 @@ def snapshot_path(base_dir: Path, platform: str, profile: str) -> Path:
     return base_dir / filename
 
 
-def write_snapshot(html: str, base_dir: Path, platform: str, profile: str) -> Path:
-    """Write the latest HTML snapshot atomically and return its path."""
+def write_snapshot(html: Union[str, bytes], base_dir: Path, platform: str, profile: str) -> Path:
+    """Write the latest HTML snapshot atomically and return its path.
+
+    `html` may be the UTF-8 bytes already encoded for hashing; they are written as is.
+    """
     dest = snapshot_path(base_dir, platform, profile)
-    atomic_write_text(dest, html)
+    if isinstance(html, bytes):
+        atomic_write_bytes(dest, html)
+    else:
+        atomic_write_text(dest, html)
     return dest
 
 
@@ -10,17 +10,88 @@ If configuration is missing, it logs and no-ops.
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import time
-from typing import Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import structlog
 
+try:
+    import httpx  # optional: lets send_batch share one async client
+except ImportError:
+    httpx = None
+
 logger = structlog.get_logger("telegram_notifier")
 
+_MAX_ATTEMPTS = 4  # ensures at least 2 retries after first attempt
+
+
+def _outcome(resp) -> Tuple[str, float]:
+    """Classify a sendMessage response as sent/retry/too_long/failed, plus retry delay.
+
+    Works with both requests and httpx responses.
+    """
+    if resp.status_code == 200:
+        return "sent", 0.0
+
+    try:
+        data = resp.json()
+    except Exception:
+        data = {}
+
+    if resp.status_code == 429:
+        retry_after = 1
+        try:
+            retry_after = int((data.get("parameters") or {}).get("retry_after", 1))
+        except Exception:
+            pass
+        logger.error("Flood control: retrying later", retry_after=retry_after)
+        return "retry", retry_after + 1
+
+    if resp.status_code == 400 and isinstance(data, dict) and (
+        str(data.get("description", "")).lower().find("too long") >= 0
+    ):
+        # message too long: caller will handle chunking
+        return "too_long", 0.0
+
+    if resp.status_code >= 500:
+        logger.error("Telegram server error", status=resp.status_code)
+        return "retry", 1.5
+
+    logger.error("Failed to send Telegram message", status=resp.status_code, response=data)
+    return "failed", 0.0
+
+
+def _split_message(text: str, max_len: int = 4000) -> List[str]:
+    """Split text on newlines into parts under Telegram's 4096 limit.
+
+    With more than one part each gets a "[parte i/n]" header. max_len leaves
+    headroom for the header and formatting.
+    """
+    parts: list[str] = []
+    current: list[str] = []
+    current_len = 0
+    for line in text.split("\n"):
+        line_len = len(line) + 1  # account for newline
+        if current_len + line_len > max_len and current:
+            parts.append("\n".join(current))
+            current = [line]
+            current_len = len(line)
+        else:
+            current.append(line)
+            current_len += line_len
+    if current:
+        parts.append("\n".join(current))
+    if len(parts) <= 1:
+        return parts
+    total = len(parts)
+    return [f"[parte {idx}/{total}]\n{part}" for idx, part in enumerate(parts, start=1)]
+
 
 @dataclass
 class NotifierConfig:
@@ -50,6 +121,9 @@ class TelegramNotifier:
         except Exception:
             self.min_interval = 0.20
         self._last_sent_ts = 0.0
+        # Keep-alive pool: consecutive sends reuse the TLS connection to api.telegram.org
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
         if not token:
             logger.warning("TELEGRAM_BOT_TOKEN missing; notifier will no-op")
 
@@ -114,49 +188,22 @@ class TelegramNotifier:
                 "disable_web_page_preview": True,
             }
 
-            max_attempts = 4  # ensures at least 2 retries after first attempt
-            attempt = 0
-            while attempt < max_attempts:
-                attempt += 1
+            for _ in range(_MAX_ATTEMPTS):
                 try:
-                    resp = requests.post(url, json=payload, timeout=15)
+                    resp = self._session.post(url, json=payload, timeout=15)
                 except Exception as e:
                     logger.error("Telegram POST failed", error=str(e))
                     time.sleep(1.0)
                     continue
 
-                if resp.status_code == 200:
+                state, delay = _outcome(resp)
+                if state == "retry":
+                    time.sleep(delay)
+                    continue
+                if state == "sent":
                     self._last_sent_ts = time.time()
                     logger.info("Sent Telegram message", length=len(body_text))
                     return True
-
-                try:
-                    data = resp.json()
-                except Exception:
-                    data = {}
-
-                if resp.status_code == 429:
-                    retry_after = 1
-                    try:
-                        retry_after = int((data.get("parameters") or {}).get("retry_after", 1))
-                    except Exception:
-                        pass
-                    logger.error("Flood control: retrying later", retry_after=retry_after)
-                    time.sleep(retry_after + 1)
-                    continue
-
-                if resp.status_code == 400 and isinstance(data, dict) and (
-                    str(data.get("description", "")).lower().find("too long") >= 0
-                ):
-                    # message too long: caller will handle chunking
-                    return False
-
-                if resp.status_code >= 500:
-                    logger.error("Telegram server error", status=resp.status_code)
-                    time.sleep(1.5)
-                    continue
-
-                logger.error("Failed to send Telegram message", status=resp.status_code, response=data)
                 return False
 
             return False
@@ -167,29 +214,102 @@ class TelegramNotifier:
             return True
 
         # Heuristic: if single send failed due to size, chunk by newline respecting 4096 limit
-        max_len = 4000  # leave headroom for formatting
-        parts: list[str] = []
-        current: list[str] = []
-        current_len = 0
-        for line in text.split("\n"):
-            line_len = len(line) + 1  # account for newline
-            if current_len + line_len > max_len and current:
-                parts.append("\n".join(current))
-                current = [line]
-                current_len = len(line)
-            else:
-                current.append(line)
-                current_len += line_len
-        if current:
-            parts.append("\n".join(current))
-
+        parts = _split_message(text)
         if len(parts) <= 1:
             # Nothing to chunk or still failing
             return False
-
-        total = len(parts)
-        for idx, part in enumerate(parts, start=1):
-            header = f"[parte {idx}/{total}]\n"
-            if not _post_message(header + part):
+        for part in parts:
+            if not _post_message(part):
                 return False
         return True
+
+    def send_batch(self, messages: List[Tuple[Optional[str], str]]) -> List[bool]:
+        """Send several (chat_id, text) messages; returns one result per message.
+
+        With httpx installed the chats are served concurrently over one
+        client (HTTP/2 when h2 is available), so the batch takes about as long
+        as its busiest chat. Messages for the same chat keep their order and
+        pacing. Without httpx this is a plain loop over send_text.
+        """
+        if httpx is None or not self.token or not messages:
+            return [self.send_text(text, chat_id=target) for target, text in messages]
+        return asyncio.run(self._send_batch_async(messages))
+
+    async def _send_batch_async(self, messages: List[Tuple[Optional[str], str]]) -> List[bool]:
+        results = [False] * len(messages)
+        by_chat: dict[str, list[int]] = {}
+        for idx, (target, _text) in enumerate(messages):
+            target = target or self.default_chat_id
+            if not target:
+                logger.warning("No chat_id provided and TELEGRAM_SUPPORT_CHANNEL_ID is missing")
+                continue
+            by_chat.setdefault(str(target), []).append(idx)
+
+        try:
+            client = httpx.AsyncClient(http2=True, timeout=15)
+        except ImportError:
+            # h2 missing: same client over HTTP/1.1
+            client = httpx.AsyncClient(timeout=15)
+
+        async def _drain(target: str, indexes: list[int]) -> None:
+            for n, idx in enumerate(indexes):
+                if n:
+                    await asyncio.sleep(self.min_interval)
+                results[idx] = await self._post_async(client, target, messages[idx][1])
+
+        async with client:
+            await asyncio.gather(*(_drain(t, ix) for t, ix in by_chat.items()))
+        return results
+
+    async def _post_async(self, client, target: str, text: str) -> bool:
+        """Async counterpart of send_text's single post, with the same retry rules."""
+        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        payload = {
+            "chat_id": target,
+            "text": text,
+            "disable_web_page_preview": True,
+        }
+        for _ in range(_MAX_ATTEMPTS):
+            try:
+                resp = await client.post(url, json=payload)
+            except Exception as e:
+                logger.error("Telegram POST failed", error=str(e))
+                await asyncio.sleep(1.0)
+                continue
+
+            state, delay = _outcome(resp)
+            if state == "retry":
+                await asyncio.sleep(delay)
+                continue
+            if state == "too_long":
+                parts = _split_message(text)
+                if len(parts) <= 1:
+                    return False
+                # Parts go out in order on this client, paced like the rest of the chat
+                for n, part in enumerate(parts):
+                    if n:
+                        await asyncio.sleep(self.min_interval)
+                    if not await self._post_async(client, target, part):
+                        return False
+                return True
+            if state == "sent":
+                self._last_sent_ts = time.time()
+                logger.info("Sent Telegram message", length=len(text))
+                return True
+            return False
+
+        return False
+
+
+def send_outbox(notifier: TelegramNotifier, outbox: List[tuple]) -> List[bool]:
+    """Send queued (target, text, log event, log fields) messages; one delivery flag each.
+
+    The whole outbox goes out as one notifier batch: chats are served
+    concurrently, messages for the same chat keep queue order and pacing.
+    """
+    if not outbox:
+        return []
+    results = notifier.send_batch([(target, text) for target, text, _event, _fields in outbox])
+    for (target, _text, event, fields), ok in zip(outbox, results):
+        logger.info(event, ok=ok, target=target, **fields)
+    return [bool(ok) for ok in results]
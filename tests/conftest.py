@@ -0,0 +1,80 @@
+"""
+Shared pytest fixtures.
+"""
+import asyncio
+import time
+
+import pytest
+
+
+class FakeClock:
+    """Virtual monotonic clock for send pacing tests.
+
+    ``install(module)`` swaps the module's ``asyncio`` and ``time`` globals for
+    proxies whose ``sleep``/``monotonic``/``time`` read and advance this clock,
+    so pacing code runs instantly and every requested delay is recorded.
+    """
+
+    def __init__(self, monkeypatch):
+        self._monkeypatch = monkeypatch
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay, result=None):
+        self.sleeps.append(delay)
+        self.now += max(delay, 0)
+        await asyncio.sleep(0)  # still yield to the other tasks
+        return result
+
+    def install(self, module):
+        clock = self
+
+        class _Asyncio:
+            sleep = staticmethod(clock.sleep)
+
+            def __getattr__(self, name):
+                return getattr(asyncio, name)
+
+        class _Time:
+            monotonic = staticmethod(clock.monotonic)
+            time = staticmethod(clock.monotonic)
+
+            def sleep(self, delay):
+                clock.sleeps.append(delay)
+                clock.now += max(delay, 0)
+
+            def __getattr__(self, name):
+                return getattr(time, name)
+
+        self._monkeypatch.setattr(module, "asyncio", _Asyncio())
+        self._monkeypatch.setattr(module, "time", _Time())
+        return self
+
+
+class InFlight:
+    """Counts overlapping awaits of ``call()``; ``peak`` is the most at once."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    async def call(self):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        # A few scheduler turns: overlapping callers all get in before anyone leaves
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.current -= 1
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    return FakeClock(monkeypatch)
+
+
+@pytest.fixture
+def in_flight():
+    return InFlight()
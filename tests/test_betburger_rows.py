@@ -0,0 +1,71 @@
+"""
+Parity tests for the Betburger row extractors.
+
+src.parsers.betburger_html.extract_rows (lxml) is what the senders use;
+_extract_rows_soup in the first-tab script is its BeautifulSoup fallback.
+Both must return the same rows for the same page.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+# The script imports the browser stack at module level
+pytest.importorskip("selenium")
+pytest.importorskip("requests")
+
+from src.parsers.betburger_html import extract_rows
+from scripts.betburger_send_first_tab_results import _extract_rows_soup
+
+SAMPLES = sorted((ROOT / "logs" / "html").glob("betburger-*.html"))
+
+# Four book pairs per row (only three are kept), rows repeated with different
+# case and markup (deduplicated), and more rows than max_items
+SYNTHETIC = """
+<html><body>
+<h2>Fútbol</h2>
+<ul>
+  <li><a>Real Madrid vs Barcelona</a> <span>2.35%ROI</span>
+      <span>bet365: 2.10 winamax: 1.95 codere: 2.05 retabet: 1.90</span> <span>21:00</span></li>
+  <li><a>REAL MADRID vs BARCELONA</a> <span>2.35%ROI</span>
+      <span>BET365: 2.10 WINAMAX: 1.95 CODERE: 2.05 RETABET: 1.90</span> <span>21:00</span></li>
+  <li><span>Real Madrid vs Barcelona</span> <span>2.35%ROI</span>
+      <a>bet365: 2.10 winamax: 1.95 codere: 2.05 retabet: 1.90</a> <span>21:00</span></li>
+  <li><a>Sevilla - Betis</a> <span>1.10%ROI</span> <span>bet365: 1.80 winamax: 2.30</span> <span>45 min</span></li>
+  <li><a>Valencia - Villarreal</a> <span>0.75%ROI</span> <span>codere: 3.10 retabet: 1.50</span></li>
+  <li><a>Getafe vs Osasuna</a> <span>3.05%ROI</span> <span>bet365: 2.60 codere: 1.70</span></li>
+  <li><a>Girona vs Celta</a> <span>1.45%ROI</span> <span>winamax: 2.20 retabet: 1.95</span></li>
+  <li><a>Alaves vs Mallorca</a> <span>0.50%ROI</span> <span>bet365: 1.99 winamax: 2.01</span></li>
+</ul>
+<h2>Tenis</h2>
+<div><a>Alcaraz vs Sinner</a> <span>4.20%ROI</span> <span>bet365: 1.85 codere: 2.25 winamax: 1.90</span></div>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("path", SAMPLES, ids=lambda p: p.name)
+def test_extractors_agree_on_stored_pages(path):
+    html = path.read_text(encoding="utf-8", errors="ignore")
+    for max_items in (5, 20):
+        assert extract_rows(html, max_items=max_items) == _extract_rows_soup(html, max_items=max_items)
+
+
+@pytest.mark.parametrize("max_items", [1, 3, 5, 10])
+def test_extractors_agree_on_cap_and_dedup(max_items):
+    rows = extract_rows(SYNTHETIC, max_items=max_items)
+    assert rows == _extract_rows_soup(SYNTHETIC, max_items=max_items)
+    assert len(rows) == min(max_items, 7)
+
+
+def test_books_capped_at_three_pairs_and_rows_deduplicated():
+    rows = extract_rows(SYNTHETIC, max_items=10)
+    first = rows[0]
+    # Row text has five "name odd" pairs (the team before the percent counts)
+    assert first["books"] == "Barcelona:2.35, bet365:2.10, winamax:1.95"
+    assert first["sport"] == "Fútbol"
+    # The upper-case copy collapses into the first row; the re-marked-up copy
+    # has the same text too
+    assert sum(r["match"].lower().startswith("real madrid vs barcelona") for r in rows) == 1
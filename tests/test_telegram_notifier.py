@@ -0,0 +1,113 @@
+"""
+Offline tests for TelegramNotifier.send_batch.
+
+httpx is replaced by a fake async client, so nothing reaches Telegram.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("requests")
+
+import utils.telegram_notifier as tn
+from utils.telegram_notifier import NotifierConfig, TelegramNotifier
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data or {"ok": status_code == 200}
+        self.text = str(self._data)
+
+    def json(self):
+        return self._data
+
+
+class FakeTransport:
+    """Stands in for the httpx module: every AsyncClient shares one post log."""
+
+    def __init__(self, clock, in_flight, responses=None):
+        self.clock = clock
+        self.in_flight = in_flight
+        # chat_id -> queued responses to return before falling back to 200
+        self.responses = responses or {}
+        self.posts = []
+
+    def AsyncClient(self, **kwargs):
+        return FakeAsyncClient(self)
+
+
+class FakeAsyncClient:
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def post(self, url, json=None):
+        t = self.transport
+        t.posts.append((json["chat_id"], json["text"], t.clock.monotonic()))
+        await t.in_flight.call()
+        queued = t.responses.get(json["chat_id"])
+        return queued.pop(0) if queued else FakeResponse(200)
+
+
+def _notifier(monkeypatch, fake_clock, in_flight, responses=None):
+    transport = FakeTransport(fake_clock.install(tn), in_flight, responses)
+    monkeypatch.setattr(tn, "httpx", transport)
+    monkeypatch.setenv("TELEGRAM_MIN_INTERVAL_SEC", "0.2")
+    notifier = TelegramNotifier(NotifierConfig(bot_token="123:token", default_chat_id="support"))
+    return notifier, transport
+
+
+def test_batch_paces_one_chat_in_order(monkeypatch, fake_clock, in_flight):
+    notifier, transport = _notifier(monkeypatch, fake_clock, in_flight)
+
+    assert notifier.send_batch([("chat", "m0"), ("chat", "m1"), ("chat", "m2")]) == [True, True, True]
+    assert [text for _chat, text, _t in transport.posts] == ["m0", "m1", "m2"]
+    assert fake_clock.sleeps == [0.2, 0.2]
+    assert in_flight.peak == 1
+
+
+def test_batch_serves_chats_concurrently(monkeypatch, fake_clock, in_flight):
+    notifier, transport = _notifier(monkeypatch, fake_clock, in_flight)
+
+    assert notifier.send_batch([("a", "m"), ("b", "m"), ("c", "m")]) == [True, True, True]
+    assert in_flight.peak == 3
+
+
+def test_batch_sends_missing_chat_id_to_support_channel(monkeypatch, fake_clock, in_flight):
+    notifier, transport = _notifier(monkeypatch, fake_clock, in_flight)
+
+    assert notifier.send_batch([(None, "alert")]) == [True]
+    assert [chat for chat, _text, _t in transport.posts] == ["support"]
+
+
+def test_batch_waits_out_flood_control(monkeypatch, fake_clock, in_flight):
+    flood = FakeResponse(429, {"ok": False, "parameters": {"retry_after": 7}})
+    notifier, transport = _notifier(monkeypatch, fake_clock, in_flight, responses={"chat": [flood]})
+
+    assert notifier.send_batch([("chat", "m")]) == [True]
+    # retry_after plus the one-second margin added by _outcome
+    assert fake_clock.sleeps == [8]
+    assert [t for _chat, _text, t in transport.posts] == [0.0, 8.0]
+
+
+def test_batch_splits_too_long_message_on_the_same_client(monkeypatch, fake_clock, in_flight):
+    too_long = FakeResponse(400, {"ok": False, "description": "Bad Request: message is too long"})
+    notifier, transport = _notifier(monkeypatch, fake_clock, in_flight, responses={"chat": [too_long]})
+    text = "\n".join(["x" * 99] * 60)  # 6000 chars -> two parts
+
+    assert notifier.send_batch([("chat", text)]) == [True]
+    texts = [t for _chat, t, _when in transport.posts]
+    assert texts[0] == text
+    assert [t.split("\n", 1)[0] for t in texts[1:]] == ["[parte 1/2]", "[parte 2/2]"]
+    assert "\n".join(t.split("\n", 1)[1] for t in texts[1:]) == text
+    assert fake_clock.sleeps == [0.2]
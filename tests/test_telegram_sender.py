@@ -0,0 +1,124 @@
+"""
+Offline tests for TelegramSender setup and send pacing.
+
+python-telegram-bot is replaced by small fakes, so nothing reaches Telegram.
+"""
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import notifications.telegram_sender as ts
+from notifications.telegram_sender import TelegramSender
+
+
+class FakeHTTPXRequest:
+    """Mimics PTB 20.7: http_version="2" without h2 raises RuntimeError."""
+
+    h2_installed = False
+
+    def __init__(self, http_version="1.1", **kwargs):
+        if http_version == "2" and not self.h2_installed:
+            raise RuntimeError("To use HTTP/2, PTB must be installed via pip install python-telegram-bot[http2]")
+        self.http_version = http_version
+
+
+class FakeBot:
+    def __init__(self, token, request=None, get_updates_request=None):
+        self.token = token
+        self.request = request
+
+
+def _patch_ptb(monkeypatch, h2_installed):
+    real_find_spec = ts.importlib.util.find_spec
+    monkeypatch.setattr(ts, "telegram", object())
+    monkeypatch.setattr(ts, "Bot", FakeBot, raising=False)
+    monkeypatch.setattr(ts, "HTTPXRequest", FakeHTTPXRequest, raising=False)
+    monkeypatch.setattr(FakeHTTPXRequest, "h2_installed", h2_installed)
+    monkeypatch.setattr(
+        ts.importlib.util,
+        "find_spec",
+        lambda name, *a: (object() if h2_installed else None) if name == "h2" else real_find_spec(name, *a),
+    )
+
+
+def test_sender_without_h2_falls_back_to_http11(monkeypatch):
+    _patch_ptb(monkeypatch, h2_installed=False)
+    sender = TelegramSender("123:token")
+    assert sender.bot is not None
+    assert sender.bot.request.http_version == "1.1"
+
+
+def test_sender_with_h2_uses_http2(monkeypatch):
+    _patch_ptb(monkeypatch, h2_installed=True)
+    sender = TelegramSender("123:token")
+    assert sender.bot.request.http_version == "2"
+
+
+class RecordingBot:
+    """Fake PTB Bot: records (chat_id, text, clock time) of every send."""
+
+    def __init__(self, clock, in_flight):
+        self.clock = clock
+        self.in_flight = in_flight
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((chat_id, text, self.clock.monotonic()))
+        await self.in_flight.call()
+
+
+def _paced_sender(monkeypatch, fake_clock, in_flight):
+    monkeypatch.setattr(ts, "ParseMode", types.SimpleNamespace(MARKDOWN="Markdown"), raising=False)
+    fake_clock.install(ts)
+    sender = TelegramSender(None)
+    sender.bot = RecordingBot(fake_clock, in_flight)
+    return sender
+
+
+def _send_all(sender, messages):
+    async def run():
+        return await asyncio.gather(*(sender._send_raw_async(chat, text) for chat, text in messages))
+
+    return asyncio.run(run())
+
+
+def test_send_raw_paces_one_channel_in_fifo_order(monkeypatch, fake_clock, in_flight):
+    sender = _paced_sender(monkeypatch, fake_clock, in_flight)
+
+    assert _send_all(sender, [("chat", "m0"), ("chat", "m1"), ("chat", "m2")]) == [True, True, True]
+    assert sender.bot.sent == [("chat", "m0", 0.0), ("chat", "m1", 1.0), ("chat", "m2", 2.0)]
+    assert fake_clock.sleeps == [ts._PER_CHAT_INTERVAL, ts._PER_CHAT_INTERVAL]
+    assert in_flight.peak == 1
+
+
+def test_send_raw_overlaps_different_channels(monkeypatch, fake_clock, in_flight):
+    sender = _paced_sender(monkeypatch, fake_clock, in_flight)
+
+    assert _send_all(sender, [("a", "m"), ("b", "m"), ("c", "m")]) == [True, True, True]
+    assert in_flight.peak == 3
+    assert fake_clock.sleeps == []
+
+
+def test_sync_wrapper_inside_event_loop_raises():
+    sender = TelegramSender(None)
+
+    async def run():
+        sender.send_test_message("chat")
+
+    with pytest.raises(RuntimeError, match="await TelegramSender.send_test_message_async"):
+        asyncio.run(run())
+
+
+def test_close_closes_private_loop():
+    sender = TelegramSender(None)
+    assert sender.send_test_message("chat") is False  # no bot: runs on the private loop
+    loop = ts._sync_state.loop
+    sender.close()
+    assert loop.is_closed()
+    assert ts._sync_state.loop is None